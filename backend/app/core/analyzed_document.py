@@ -0,0 +1,60 @@
+from app.core.nlp_manager import NLPManager
+
+
+class AnalyzedDocument:
+    """
+    Read-only view over the single spaCy parse of a resume.
+
+    Built once from the ingestion Doc; every downstream stage reads tokens,
+    POS tags, lemmas and entities from here instead of calling nlp() again.
+    profiles are the spaCy profiles the Doc was parsed with; components a
+    later stage needs beyond those run on the same Doc on first use.
+    """
+
+    def __init__(self, doc, profiles: tuple = ("full",)):
+        self.doc = doc
+        self.text = doc.text
+        self.profiles = tuple(profiles)
+
+        # Non-empty sentence spans, in document order. Units produced by
+        # segmentation refer to these by index ("sent_index").
+        self.sentences = [sent for sent in doc.sents if sent.text.strip()]
+
+    @property
+    def has_entities(self) -> bool:
+        return "ner" not in NLPManager.disabled_components(*self.profiles)
+
+    def ensure(self, *profiles):
+        """Run whatever the profiles need that the parse skipped (e.g. ner)."""
+        if set(NLPManager.disabled_components(*self.profiles)) - set(NLPManager.disabled_components(*profiles)):
+            self.doc = NLPManager.add_components(self.doc, self.profiles, *profiles)
+            self.profiles += profiles
+
+    def sentence(self, index: int):
+        return self.sentences[index]
+
+    def tokens(self, index: int) -> list:
+        return [t.text for t in self.sentences[index]]
+
+    def pos_tags(self, index: int) -> list:
+        return [t.pos_ for t in self.sentences[index]]
+
+    def verb_lemmas(self, index: int) -> set:
+        return {
+            t.lemma_.lower()
+            for t in self.sentences[index]
+            if t.pos_ == "VERB"
+        }
+
+    def entities(self, label: str = None, end_char: int = None) -> list:
+        """
+        Entity texts from the shared parse, optionally filtered by label
+        and limited to entities ending before `end_char`.
+        """
+        self.ensure("entities")
+        return [
+            ent.text
+            for ent in self.doc.ents
+            if (label is None or ent.label_ == label)
+            and (end_char is None or ent.end_char <= end_char)
+        ]
@@ -0,0 +1,99 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# -------- Batch pipeline --------
+# Number of queued resumes processed together by one batch job
+PIPELINE_BATCH_SIZE = int(os.getenv("PIPELINE_BATCH_SIZE", "16"))
+
+# nlp.pipe settings used when parsing a batch of resumes
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "8"))
+# Keep SPACY_N_PROCESS at 1 with EXECUTOR_BACKEND=process; the pool already
+# provides the parallelism
+SPACY_N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))
+
+# model.encode batch size for sentence embeddings
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+
+# -------- Uploads --------
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB per file
+# A whole upload request is rejected with 413 past this size, from
+# Content-Length or as the body arrives, before Starlette spools the files
+# (default: 50 files at the per-file limit)
+MAX_UPLOAD_REQUEST_SIZE = int(os.getenv("MAX_UPLOAD_REQUEST_MB", "500")) * 1024 * 1024
+
+# -------- Compiled JD cache --------
+# In-process LRU in front of the compiled_jds table
+JD_CACHE_SIZE = int(os.getenv("JD_CACHE_SIZE", "32"))
+JD_CACHE_TTL_SECONDS = int(os.getenv("JD_CACHE_TTL_SECONDS", "3600"))
+
+# -------- Sentence embeddings --------
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
+# "torch" (fp32), "torch-int8" (dynamically quantised Linear layers) or
+# "onnx" (ONNX Runtime CPU; needs optimum[onnxruntime])
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+# Optional ONNX file inside the model repo, e.g. onnx/model_qint8_avx512.onnx
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE", "")
+
+# Cross-request micro-batching: encode calls from all worker threads are
+# pooled for up to EMBEDDING_MICROBATCH_WAIT_MS into one forward pass
+EMBEDDING_MICROBATCH_ENABLED = os.getenv("EMBEDDING_MICROBATCH_ENABLED", "true").lower() == "true"
+EMBEDDING_MICROBATCH_MAX_SIZE = int(os.getenv("EMBEDDING_MICROBATCH_MAX_SIZE", "256"))
+EMBEDDING_MICROBATCH_WAIT_MS = float(os.getenv("EMBEDDING_MICROBATCH_WAIT_MS", "5"))
+
+# On-disk content-addressed embedding cache (SQLite, float16 vectors)
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "cache/embeddings.db")
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+
+# -------- Bulk status (/resumes/status) --------
+# ?since= re-reads this far behind the cursor: a transaction stamps
+# updated_at when it writes but becomes visible when it commits, and
+# DATETIME columns may only keep whole seconds
+STATUS_SINCE_OVERLAP_SECONDS = float(os.getenv("STATUS_SINCE_OVERLAP_SECONDS", "30"))
+
+# -------- Status stream (SSE) --------
+# How often a subscription re-reads its resumes' status rows
+STATUS_STREAM_INTERVAL_SECONDS = float(os.getenv("STATUS_STREAM_INTERVAL_SECONDS", "1.0"))
+STATUS_STREAM_HEARTBEAT_SECONDS = float(os.getenv("STATUS_STREAM_HEARTBEAT_SECONDS", "15"))
+# Streams end with an "expired" event after this long; clients resubscribe if still needed
+STATUS_STREAM_MAX_SECONDS = float(os.getenv("STATUS_STREAM_MAX_SECONDS", "600"))
+
+# -------- Model loading --------
+# "background" warms models on a thread at startup (readiness waits for it),
+# "blocking" finishes loading before serving, "off" loads on first use
+MODEL_WARMUP = os.getenv("MODEL_WARMUP", "background").lower()
+
+# -------- Background execution --------
+# "thread" keeps the original in-process pool; "process" runs batches in
+# worker processes that each hold their own spaCy / MiniLM copy
+EXECUTOR_BACKEND = os.getenv("EXECUTOR_BACKEND", "thread").lower()
+EXECUTOR_MAX_WORKERS = int(os.getenv("EXECUTOR_MAX_WORKERS", "2"))
+# "forkserver" / "spawn" load models once in each worker at start (safe
+# default); "fork" preloads them in the parent and shares them
+# copy-on-write, but forks a multithreaded process
+EXECUTOR_START_METHOD = os.getenv("EXECUTOR_START_METHOD", "forkserver").lower()
+# torch / ONNX Runtime intra-op threads per process (each worker owns its model copy)
+TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS", "1"))
+
+# -------- Durable job queue --------
+JOB_RUNNER_ENABLED = os.getenv("JOB_RUNNER_ENABLED", "true").lower() == "true"
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1.0"))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "300"))
+JOB_HEARTBEAT_SECONDS = int(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BASE_SECONDS = int(os.getenv("JOB_RETRY_BASE_SECONDS", "10"))
+JOB_RETRY_MAX_SECONDS = int(os.getenv("JOB_RETRY_MAX_SECONDS", "600"))
+
+# -------- OCR (image-only PDF pages) --------
+OCR_DPI = int(os.getenv("OCR_DPI", "300"))
+# At most this many pages of one PDF are OCR'd
+OCR_MAX_PAGES = int(os.getenv("OCR_MAX_PAGES", "10"))
+# Pages OCR'd at once across the API process and all executor workers
+# (a shared semaphore); memory is about one page bitmap per slot. With
+# OCR_MAX_PAGES or more cores, a scan takes about one page's OCR time
+OCR_MAX_WORKERS = int(os.getenv("OCR_MAX_WORKERS") or min(os.cpu_count() or 1, OCR_MAX_PAGES))
+# A page whose text layer is shorter than this is treated as image-only
+OCR_MIN_PAGE_CHARS = int(os.getenv("OCR_MIN_PAGE_CHARS", "20"))
@@ -0,0 +1,150 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+
+def normalize_sentence(text: str) -> str:
+    # Whitespace differences never change the tokenised input
+    return " ".join(text.split())
+
+
+def round_to_stored(vectors) -> np.ndarray:
+    """float32 vectors exactly as a cache hit would return them (float16-rounded)."""
+    return np.asarray(vectors, dtype=np.float16).astype(np.float32)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed on-disk embedding store.
+
+    Vectors are kept as float16 blobs in a local SQLite file, keyed by
+    sha256(model name + normalised sentence). Least recently used rows are
+    evicted once the table grows past max_entries.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._entry_count = 0
+
+    # -------- Connection (one per process) --------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, "
+                "dim INTEGER NOT NULL, "
+                "vector BLOB NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_embeddings_last_used ON embeddings (last_used)"
+            )
+            self._entry_count = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        payload = f"{model_name}\0{normalize_sentence(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # -------- Lookup / store --------
+    def get_many(self, model_name: str, texts: list) -> dict:
+        """Return {text: float32 vector} for the texts already cached."""
+        keys = {self.make_key(model_name, t): t for t in texts}
+        found = {}
+
+        with self._lock:
+            conn = self._connection()
+            key_list = list(keys)
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(key_list), 500):
+                chunk = key_list[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, dim, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for key, dim, blob in rows:
+                    # Same rounding as round_to_stored
+                    vector = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+                    found[keys[key]] = vector.reshape(dim)
+
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, self.make_key(model_name, t)) for t in found]
+                )
+                conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def put_many(self, model_name: str, texts: list, vectors: np.ndarray):
+        now = time.time()
+        rows = [
+            (
+                self.make_key(model_name, text),
+                int(vector.shape[0]),
+                np.asarray(vector, dtype=np.float16).tobytes(),
+                now
+            )
+            for text, vector in zip(texts, vectors)
+        ]
+
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vector, last_used) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._entry_count += len(rows)
+
+            # -------- LRU eviction --------
+            if self._entry_count > self.max_entries:
+                self._entry_count = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+                excess = self._entry_count - self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM embeddings WHERE key IN ("
+                        "SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                        (excess,)
+                    )
+                    self._entry_count -= excess
+                    self.evictions += excess
+
+            conn.commit()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "path": self.path,
+            "entries": self._entry_count,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
@@ -0,0 +1,134 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from app.core.nlp_manager import NLPManager
+
+
+class EmbeddingService:
+    """
+    Cross-request micro-batcher in front of the sentence embedding model.
+
+    Callers on any thread submit a list of texts and get a Future. A single
+    service thread collects submissions for up to max_wait_ms (or until
+    max_batch_size texts are waiting). It deduplicates them, sorts them by
+    length to reduce padding, runs one encode call and scatters the rows
+    back to each caller's Future. Only this thread touches the model.
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float, encode_batch_size: int):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.encode_batch_size = encode_batch_size
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._stats = {
+            "batches": 0,
+            "requests": 0,
+            "texts": 0,
+            "unique_texts": 0,
+            "wait_seconds": 0.0,
+            "encode_seconds": 0.0
+        }
+
+    # -------- Public API --------
+    def submit(self, texts: list) -> Future:
+        future = Future()
+        if not texts:
+            future.set_result(np.zeros((0, 0), dtype=np.float32))
+            return future
+
+        self._ensure_thread()
+        self._queue.put((list(texts), future, time.perf_counter()))
+        return future
+
+    def encode(self, texts: list) -> np.ndarray:
+        """Blocking helper: float32 matrix, one row per input text."""
+        return self.submit(texts).result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            s = dict(self._stats)
+        batches = s["batches"] or 1
+        return {
+            "batches": s["batches"],
+            "requests": s["requests"],
+            "texts": s["texts"],
+            "unique_texts": s["unique_texts"],
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "avg_requests_per_batch": round(s["requests"] / batches, 2),
+            "avg_batch_fill": round(s["unique_texts"] / (batches * self.max_batch_size), 4),
+            "avg_wait_ms": round(s["wait_seconds"] * 1000 / max(s["requests"], 1), 2),
+            "avg_encode_ms": round(s["encode_seconds"] * 1000 / batches, 2)
+        }
+
+    # -------- Internals --------
+    def _ensure_thread(self):
+        # A forked worker inherits the attributes but not the running thread
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._thread.start()
+
+    def _collect(self) -> list:
+        pending = [self._queue.get()]
+        total = len(pending[0][0])
+        deadline = time.perf_counter() + self.max_wait
+
+        while total < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.append(item)
+            total += len(item[0])
+
+        return pending
+
+    def _run(self):
+        while True:
+            pending = self._collect()
+            try:
+                self._encode_batch(pending)
+            except Exception as e:
+                for _, future, _ in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _encode_batch(self, pending: list):
+        started = time.perf_counter()
+
+        # Shortest first so each encode mini-batch pads to similar lengths
+        unique = sorted(dict.fromkeys(t for texts, _, _ in pending for t in texts), key=len)
+
+        model = NLPManager.get_sentence_transformer()
+        vectors = np.asarray(
+            model.encode(unique, batch_size=self.encode_batch_size),
+            dtype=np.float32
+        )
+        row_of = {text: i for i, text in enumerate(unique)}
+
+        for texts, future, _ in pending:
+            future.set_result(vectors[[row_of[t] for t in texts]])
+
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["requests"] += len(pending)
+            self._stats["texts"] += sum(len(texts) for texts, _, _ in pending)
+            self._stats["unique_texts"] += len(unique)
+            self._stats["wait_seconds"] += sum(started - submitted for _, _, submitted in pending)
+            self._stats["encode_seconds"] += time.perf_counter() - started
@@ -0,0 +1,68 @@
+import numpy as np
+
+from app.core.config import (
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_MAX_ENTRIES,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_MICROBATCH_ENABLED,
+    EMBEDDING_MICROBATCH_MAX_SIZE,
+    EMBEDDING_MICROBATCH_WAIT_MS,
+)
+from app.core.embedding_cache import EmbeddingCache, round_to_stored
+from app.core.embedding_service import EmbeddingService
+from app.core.nlp_manager import NLPManager
+
+embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ENTRIES)
+embedding_service = EmbeddingService(
+    EMBEDDING_MICROBATCH_MAX_SIZE,
+    EMBEDDING_MICROBATCH_WAIT_MS,
+    EMBEDDING_BATCH_SIZE
+)
+
+
+def encode_texts(texts: list, batch_size: int = EMBEDDING_BATCH_SIZE) -> np.ndarray:
+    """
+    Single entry point for sentence embeddings.
+
+    Returns a float32 matrix with one row per input text. Vectors already in
+    the on-disk cache are reused; only the misses go through the model,
+    pooled with other callers' misses by the micro-batcher.
+
+    Every vector is float16-rounded, fresh or cached (and with the cache
+    off), so a resume scores the same on its first run and on later ones.
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    # Vectors from different backends differ slightly, so each has its own keys
+    model_key = NLPManager.embedding_model_key()
+
+    cached = {}
+    if EMBEDDING_CACHE_ENABLED:
+        try:
+            cached = embedding_cache.get_many(model_key, texts)
+        except Exception as e:
+            print(f"[Embeddings] Cache read failed: {e}")
+
+    missing = list(dict.fromkeys(t for t in texts if t not in cached))
+    if missing:
+        if EMBEDDING_MICROBATCH_ENABLED:
+            vectors = embedding_service.encode(missing)
+        else:
+            model = NLPManager.get_sentence_transformer()
+            vectors = np.asarray(
+                model.encode(missing, batch_size=batch_size),
+                dtype=np.float32
+            )
+        # Return misses as the cache stores them
+        vectors = round_to_stored(vectors)
+        cached.update(zip(missing, vectors))
+
+        if EMBEDDING_CACHE_ENABLED:
+            try:
+                embedding_cache.put_many(model_key, missing, vectors)
+            except Exception as e:
+                print(f"[Embeddings] Cache write failed: {e}")
+
+    return np.stack([cached[t] for t in texts]).astype(np.float32, copy=False)
@@ -1,28 +1,183 @@
-import spacy
-from sentence_transformers import SentenceTransformer
+import threading
+import time
 
+from app.core.config import (
+    EMBEDDING_BACKEND,
+    EMBEDDING_MODEL_NAME,
+    EMBEDDING_ONNX_FILE,
+    TORCH_NUM_THREADS,
+)
+
+EMBEDDING_BACKENDS = ("torch", "torch-int8", "onnx")
+
+# Named spaCy pipeline profiles: the components a consumer needs from a
+# parse. Everything else is skipped for that call. None means the full
+# pipeline.
+SPACY_PROFILES = {
+    "full": None,
+    "sentences": ("tok2vec", "parser"),
+    "pos": ("tok2vec", "tagger", "attribute_ruler"),
+    "syntax": ("tok2vec", "tagger", "attribute_ruler", "parser"),
+    "verbs": ("tok2vec", "tagger", "attribute_ruler", "lemmatizer"),
+    "roles": ("tok2vec", "tagger", "attribute_ruler", "parser", "lemmatizer"),
+    "entities": ("tok2vec", "ner"),
+}
 
-import torch
 
 class NLPManager:
+    """
+    Process-wide model holder. Nothing is imported or loaded until a model
+    is first asked for (or warm_up() is called), so importing the app or a
+    pipeline module stays cheap.
+    """
     _spacy_model = None
     _st_model = None
+    _lock = threading.Lock()
+    _load_seconds = {}
+    _load_errors = {}
 
     @classmethod
     def get_spacy(cls):
         if cls._spacy_model is None:
-            try:
-                cls._spacy_model = spacy.load("en_core_web_sm")
-            except OSError:
-                raise RuntimeError(
-                    "spaCy model 'en_core_web_sm' not found. "
-                    "Please install it by running: python -m spacy download en_core_web_sm"
-                )
+            with cls._lock:
+                if cls._spacy_model is None:
+                    cls._spacy_model = cls._timed_load("spacy", cls._load_spacy)
         return cls._spacy_model
 
     @classmethod
     def get_sentence_transformer(cls):
         if cls._st_model is None:
-            torch.set_num_threads(1)
-            cls._st_model = SentenceTransformer("all-MiniLM-L6-v2")
+            with cls._lock:
+                if cls._st_model is None:
+                    cls._st_model = cls._timed_load(
+                        "sentence_transformer",
+                        lambda: cls.load_sentence_transformer(EMBEDDING_BACKEND)
+                    )
         return cls._st_model
+
+    @staticmethod
+    def embedding_model_key(backend: str = EMBEDDING_BACKEND) -> str:
+        """
+        Identifies the vectors a backend produces (embedding cache key).
+        fp32 torch keeps the bare model name so existing caches stay valid.
+        """
+        if backend == "torch":
+            return EMBEDDING_MODEL_NAME
+        return f"{EMBEDDING_MODEL_NAME}@{backend}"
+
+    @classmethod
+    def disabled_components(cls, *profiles) -> list:
+        """Components none of the given profiles need, for nlp(..., disable=...)."""
+        needed = set()
+        for profile in profiles or ("full",):
+            components = SPACY_PROFILES[profile]
+            if components is None:
+                return []
+            needed.update(components)
+        return [name for name in cls.get_spacy().pipe_names if name not in needed]
+
+    @classmethod
+    def parse(cls, text: str, *profiles):
+        """
+        Parse with only the components the profiles need. disable= is per
+        call, so the shared pipeline is never mutated across threads.
+        """
+        return cls.get_spacy()(text, disable=cls.disabled_components(*profiles))
+
+    @classmethod
+    def parse_many(cls, texts: list, *profiles, **pipe_kwargs):
+        return cls.get_spacy().pipe(texts, disable=cls.disabled_components(*profiles), **pipe_kwargs)
+
+    @classmethod
+    def add_components(cls, doc, parsed_profiles: tuple, *profiles):
+        """
+        Run on an already parsed Doc the components that profiles need but
+        its parse (with parsed_profiles) skipped, in pipeline order.
+        """
+        skipped = set(cls.disabled_components(*parsed_profiles))
+        missing = skipped - set(cls.disabled_components(*profiles))
+        for name, component in cls.get_spacy().pipeline:
+            if name in missing:
+                doc = component(doc)
+        return doc
+
+    @staticmethod
+    def _load_spacy():
+        import spacy
+
+        try:
+            return spacy.load("en_core_web_sm")
+        except OSError:
+            raise RuntimeError(
+                "spaCy model 'en_core_web_sm' not found. "
+                "Please install it by running: python -m spacy download en_core_web_sm"
+            )
+
+    @staticmethod
+    def load_sentence_transformer(backend: str):
+        """Build the embedding model for one backend (uncached; see get_sentence_transformer)."""
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        if backend not in EMBEDDING_BACKENDS:
+            raise RuntimeError(
+                f"Unknown EMBEDDING_BACKEND '{backend}'. Use one of: {', '.join(EMBEDDING_BACKENDS)}"
+            )
+
+        torch.set_num_threads(TORCH_NUM_THREADS)
+
+        if backend == "onnx":
+            try:
+                import onnxruntime
+            except ImportError:
+                raise RuntimeError(
+                    "EMBEDDING_BACKEND=onnx needs ONNX Runtime. "
+                    "Install it with: pip install \"optimum[onnxruntime]\""
+                )
+
+            session_options = onnxruntime.SessionOptions()
+            session_options.intra_op_num_threads = TORCH_NUM_THREADS
+            model_kwargs = {"provider": "CPUExecutionProvider", "session_options": session_options}
+            if EMBEDDING_ONNX_FILE:
+                model_kwargs["file_name"] = EMBEDDING_ONNX_FILE
+            return SentenceTransformer(EMBEDDING_MODEL_NAME, backend="onnx", model_kwargs=model_kwargs)
+
+        if backend == "torch-int8":
+            # int8 weights for every Linear layer, activations quantised on the fly (CPU only)
+            model = SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu")
+            torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+            return model
+
+        return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+    @classmethod
+    def _timed_load(cls, name: str, loader):
+        started = time.perf_counter()
+        try:
+            model = loader()
+        except Exception as e:
+            cls._load_errors[name] = str(e)
+            raise
+        cls._load_seconds[name] = round(time.perf_counter() - started, 3)
+        cls._load_errors.pop(name, None)
+        print(f"[Models] Loaded {name} in {cls._load_seconds[name]:.2f}s")
+        return model
+
+    @classmethod
+    def warm_up(cls) -> dict:
+        """Load every model now instead of on first use. Returns load times."""
+        cls.get_spacy()
+        cls.get_sentence_transformer()
+        return dict(cls._load_seconds)
+
+    @classmethod
+    def status(cls) -> dict:
+        """Load state of each model, for readiness checks."""
+        return {
+            name: {
+                "loaded": model is not None,
+                "load_seconds": cls._load_seconds.get(name),
+                "error": cls._load_errors.get(name)
+            }
+            for name, model in (("spacy", cls._spacy_model), ("sentence_transformer", cls._st_model))
+        }
@@ -0,0 +1,88 @@
+import threading
+import time
+
+from app.core.config import EMBEDDING_BACKEND
+from app.core.nlp_manager import NLPManager
+
+# Seconds spent in each startup phase: import, db_init, model_load
+startup_timings = {}
+
+_state = {
+    "database": False,
+    "warm_up": "not_started",  # not_started | running | done | failed
+    "error": None
+}
+
+
+def record_timing(phase: str, seconds: float):
+    startup_timings[phase] = round(seconds, 3)
+
+
+def init_database():
+    from app.database import init_db
+
+    started = time.perf_counter()
+    init_db()
+    record_timing("db_init", time.perf_counter() - started)
+    _state["database"] = True
+
+
+def _warm_up():
+    _state["warm_up"] = "running"
+    started = time.perf_counter()
+    try:
+        NLPManager.warm_up()
+    except Exception as e:
+        _state["warm_up"] = "failed"
+        _state["error"] = str(e)
+        print(f"[Startup] Model warm-up failed: {e}")
+        return
+    record_timing("model_load", time.perf_counter() - started)
+    _state["warm_up"] = "done"
+
+
+def _warm_up_and_report():
+    _warm_up()
+    print_startup_report()
+
+
+def start_warm_up(mode: str):
+    """
+    mode "blocking" loads the models before startup finishes, "background"
+    loads them on a thread while the API already serves requests, "off"
+    leaves them to load on first use.
+    """
+    if mode == "blocking":
+        _warm_up()
+    elif mode == "background":
+        threading.Thread(target=_warm_up_and_report, name="model-warm-up", daemon=True).start()
+
+
+def is_ready(mode: str) -> bool:
+    if not _state["database"]:
+        return False
+    if mode == "off":
+        return True
+    return _state["warm_up"] == "done"
+
+
+def readiness(mode: str) -> dict:
+    return {
+        "ready": is_ready(mode),
+        "database": _state["database"],
+        "warm_up": _state["warm_up"] if mode != "off" else "off",
+        "warm_up_error": _state["error"],
+        "models": NLPManager.status(),
+        "embedding_backend": EMBEDDING_BACKEND,
+        "startup_seconds": dict(startup_timings)
+    }
+
+
+def print_startup_report():
+    phases = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in startup_timings.items())
+    models = ", ".join(
+        f"{name} {state['load_seconds']:.2f}s"
+        for name, state in NLPManager.status().items()
+        if state["load_seconds"] is not None
+    )
+    print(f"[Startup] {phases}" + (f" (models: {models})" if models else ""))
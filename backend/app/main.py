@@ -1,19 +1,33 @@
+import time
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI
-from app.database import engine, Base
 
-from app.routers.upload import router as upload_router
+from app.routers.upload import router as upload_router, UPLOAD_PATHS
 from app.routers.status import router as status_router
 from app.routers.results import router as results_router
 from app.routers.jd import router as jd_router
+from app.routers.metrics import router as metrics_router
+from app.routers.rerank import router as rerank_router
+from app.routers.health import router as health_router
 from fastapi.middleware.cors import CORSMiddleware
-
-Base.metadata.create_all(bind=engine)
+from app.workers.executor import start_executor, shutdown_executor
+from app.pipeline.ocr_engine import shutdown_ocr_pool
+from app.workers.job_runner import job_runner
+from app.core.config import JOB_RUNNER_ENABLED, MODEL_WARMUP, MAX_UPLOAD_REQUEST_SIZE
+from app.utils.upload_stream import UploadSizeLimitMiddleware
+from app.core.startup import record_timing, init_database, start_warm_up, print_startup_report
 
 app = FastAPI(
     title="AI Resume Screening System",
     version="1.0"
 )
 
+# Oversized uploads are refused before the multipart body is received
+# (added first so CORS, outermost, still decorates the 413)
+app.add_middleware(UploadSizeLimitMiddleware, max_size=MAX_UPLOAD_REQUEST_SIZE, paths=UPLOAD_PATHS)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],   # For development
@@ -26,3 +40,34 @@ app.include_router(upload_router, prefix="/api")
 app.include_router(status_router, prefix="/api")
 app.include_router(results_router, prefix="/api")
 app.include_router(jd_router, prefix="/api")
+app.include_router(metrics_router, prefix="/api")
+app.include_router(rerank_router, prefix="/api")
+app.include_router(health_router, prefix="/api")
+
+record_timing("import", time.perf_counter() - _import_started)
+
+
+@app.on_event("startup")
+def initialise():
+    # Tables are created here rather than at import, so importing the app
+    # (tests, tooling) does not touch the database
+    init_database()
+    # Before any background thread starts (see start_executor)
+    start_executor()
+    # Models load lazily; warm-up just moves that cost to startup
+    start_warm_up(MODEL_WARMUP)
+    print_startup_report()
+
+
+@app.on_event("startup")
+def start_job_runner():
+    # Recovers expired leases, then pulls queued jobs from the jobs table
+    if JOB_RUNNER_ENABLED:
+        job_runner.start()
+
+
+@app.on_event("shutdown")
+def stop_background_executor():
+    job_runner.stop()
+    shutdown_executor(wait=False)
+    shutdown_ocr_pool(wait=False)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, DateTime, Boolean, JSON, LargeBinary, Integer
+from datetime import datetime
+from app.database import Base
+
+class CompiledJD(Base):
+    __tablename__ = "compiled_jds"
+
+    jd_hash = Column(String(64), primary_key=True)
+    compiler_version = Column(Integer, default=1)
+    mandatory_skills = Column(JSON, nullable=True)
+    optional_skills = Column(JSON, nullable=True)
+    experience_range = Column(JSON, nullable=True)
+    education_required = Column(Boolean, default=False)
+    jd_embedding = Column(LargeBinary, nullable=True)  # float32 bytes
+    embedding_model = Column(String(200), nullable=True)  # NLPManager.embedding_model_key() of jd_embedding
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, Integer
+from app.database import Base
+
+class DataVersion(Base):
+    """Change counters bumped in the same transaction as the writes they track."""
+    __tablename__ = "data_versions"
+
+    name = Column(String(50), primary_key=True)  # e.g. "resume_features"
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, String, DateTime, Enum, Integer, Text, JSON, Index
+from datetime import datetime
+from app.database import Base
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(30), nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(
+        Enum(
+            "QUEUED",
+            "LEASED",
+            "DONE",
+            "FAILED"
+        ),
+        default="QUEUED"
+    )
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    available_at = Column(DateTime, default=datetime.utcnow)
+    lease_owner = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_jobs_status_available_at", "status", "available_at"),
+        Index("ix_jobs_status_lease_expires_at", "status", "lease_expires_at"),
+    )
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, DateTime, Enum, Float, Text, JSON
+from sqlalchemy import Column, String, DateTime, Enum, Float, Integer, Text, JSON, Index, func
+from sqlalchemy.orm import deferred
 from datetime import datetime
 from app.database import Base
 
@@ -7,6 +8,7 @@ class Resume(Base):
 
     resume_id = Column(String(50), primary_key=True, index=True)
     candidate_name = Column(String(200), nullable=True)
+    display_id = Column(String(50), nullable=True)  # Readable FirstLast_XXXX, assigned by the worker
     jd_hash = Column(String(64), nullable=True)  # Hash of JD for grouping
     status = Column(
         Enum(
@@ -19,10 +21,38 @@ class Resume(Base):
         default="UPLOADED"
     )
     upload_time = Column(DateTime, default=datetime.utcnow)
+    # Bumped on every ORM write; drives bulk status ETags and "since" cursors.
+    # Set by the database clock (not each worker's) so those cursors compare
+    # against one time source
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), index=True)
     quality_score = Column(Float, nullable=True)
     final_score = Column(Float, nullable=True)
     decision = Column(String(20), nullable=True)
+    # Per-engine scores (0-100) and decision reasons, written with the decision
+    skill_match_score = Column(Float, nullable=True)
+    experience_score = Column(Float, nullable=True)
+    education_score = Column(Float, nullable=True)
+    semantic_score = Column(Float, nullable=True)
+    explanations = deferred(Column(JSON, nullable=True))
     error_message = Column(Text, nullable=True)
-    extracted_text = Column(Text, nullable=True)
-    skill_data = Column(JSON, nullable=True)
+    # Large payloads, only loaded when accessed (or undefer()ed) so status,
+    # listing and worker lookups do not drag them out of the database
+    extracted_text = deferred(Column(Text, nullable=True), group="payload")
+    skill_data = deferred(Column(JSON, nullable=True), group="payload")
     file_path = Column(String(500), nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded bytes
+    reused_from = Column(String(50), nullable=True)  # resume whose results/features were reused
+    dedup_kind = Column(String(20), nullable=True)  # REUSED (scores copied) or JD_ONLY (re-scored)
+    # What the stored result was computed with; only results of the current
+    # ones are copied to a duplicate upload (NULL = written before tagging)
+    jd_compiler_version = Column(Integer, nullable=True)
+    embedding_model = Column(String(200), nullable=True)
+
+    # Keyset pagination of /resumes on (upload_time, resume_id), alone and
+    # under each equality filter; the jd_hash one also serves jd_hash lookups
+    __table_args__ = (
+        Index("ix_resumes_upload_time_id", "upload_time", "resume_id"),
+        Index("ix_resumes_status_upload_time", "status", "upload_time", "resume_id"),
+        Index("ix_resumes_decision_upload_time", "decision", "upload_time", "resume_id"),
+        Index("ix_resumes_jd_hash_upload_time", "jd_hash", "upload_time", "resume_id"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, Float, Integer, JSON, LargeBinary
+from datetime import datetime
+from app.database import Base
+
+class ResumeFeatures(Base):
+    """JD-independent output of pipeline stages 1-10, reused for re-ranking."""
+    __tablename__ = "resume_features"
+
+    resume_id = Column(String(50), primary_key=True)
+    units = Column(JSON, nullable=False)
+    embedding_dim = Column(Integer, nullable=False)
+    sentence_embeddings = Column(LargeBinary(length=16 * 1024 * 1024), nullable=False)  # float16 rows aligned with units
+    embedding_model = Column(String(200), nullable=True)  # NLPManager.embedding_model_key(); NULL = written before tagging
+    entities = Column(JSON, nullable=True)
+    experience_years = Column(Float, nullable=True)
+    quality_score = Column(Float, nullable=True)
+    timeline_risk_score = Column(Float, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,83 @@
+import numpy as np
+
+from app.pipeline.sentence_embeddings import normalize_rows
+
+SEMANTIC_TOP_K = 3
+
+
+def segmented_top_k_mean(values: np.ndarray, offsets: np.ndarray, k: int) -> np.ndarray:
+    """
+    Mean of the k largest values inside each segment [offsets[i], offsets[i+1]).
+    Segments with fewer than k values use all of them; empty segments get 0.
+    """
+    counts = np.diff(offsets)
+    scores = np.zeros(len(counts), dtype=np.float32)
+    if values.size == 0:
+        return scores
+
+    segment_ids = np.repeat(np.arange(len(counts)), counts)
+
+    # Sort by segment, then by value descending; segments stay in place
+    order = np.lexsort((-values, segment_ids))
+    sorted_values = values[order]
+
+    rank_in_segment = np.arange(values.size) - np.repeat(offsets[:-1], counts)
+    keep = rank_in_segment < k
+
+    sums = np.bincount(segment_ids[keep], weights=sorted_values[keep], minlength=len(counts))
+    denominators = np.minimum(counts, k)
+    non_empty = denominators > 0
+    scores[non_empty] = sums[non_empty] / denominators[non_empty]
+    return scores
+
+
+class CorpusEmbeddingIndex:
+    """
+    Sentence embeddings of many resumes held as one contiguous,
+    row-normalised float32 matrix with per-resume offsets. Scoring the
+    whole corpus against a JD is one matrix-vector product followed by a
+    segmented top-k mean.
+    """
+
+    def __init__(self, resume_ids: list, matrix: np.ndarray, offsets: np.ndarray):
+        self.resume_ids = resume_ids
+        self.matrix = matrix
+        self.offsets = offsets
+
+    @classmethod
+    def from_segments(cls, segments: list, normalized: bool = False) -> "CorpusEmbeddingIndex":
+        """
+        Build from [(resume_id, sentence_matrix), ...]. Segments may be any
+        float dtype; they are concatenated straight into float32. Pass
+        normalized=True for rows that are already unit length (stored
+        features) to skip the normalising copy.
+        """
+        resume_ids = [resume_id for resume_id, _ in segments]
+        lengths = [len(matrix) for _, matrix in segments]
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+
+        non_empty = [matrix for _, matrix in segments if len(matrix)]
+        if non_empty:
+            matrix = np.concatenate(non_empty, dtype=np.float32)
+            if not normalized:
+                matrix = normalize_rows(matrix)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        return cls(resume_ids, matrix, offsets)
+
+    def __len__(self):
+        return len(self.resume_ids)
+
+    def semantic_scores(self, jd_embedding, k: int = SEMANTIC_TOP_K) -> np.ndarray:
+        """Semantic score of every resume, aligned with resume_ids."""
+        if self.matrix.size == 0:
+            return np.zeros(len(self.resume_ids), dtype=np.float32)
+
+        jd_vector = np.asarray(jd_embedding, dtype=np.float32).ravel()
+        jd_norm = np.linalg.norm(jd_vector)
+        if jd_norm == 0:
+            return np.zeros(len(self.resume_ids), dtype=np.float32)
+
+        similarities = self.matrix @ (jd_vector / jd_norm)
+        return segmented_top_k_mean(similarities, self.offsets, k)
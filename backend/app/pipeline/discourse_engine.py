@@ -1,8 +1,7 @@
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 
-from app.core.nlp_manager import NLPManager
-model = NLPManager.get_sentence_transformer()
+from app.core.embeddings import encode_texts
+from app.pipeline.sentence_embeddings import normalize_rows
 
 class DiscourseError(Exception):
     pass
@@ -14,24 +13,25 @@ def discourse_stage(data: dict) -> dict:
         raise DiscourseError("No units available for discourse analysis")
 
     # Only consider real sentences (ignore fragments)
-    sentences = [
-        u["text"] for u in units
+    positions = [
+        i for i, u in enumerate(units)
         if u["unit_type"] == "sentence" and not u.get("is_fragment")
     ]
+    sentences = [units[i]["text"] for i in positions]
 
     # Not enough sentences → suspicious resume
     if len(sentences) < 3:
         discourse_score = 0.0
     else:
-        embeddings = model.encode(sentences)
-
-        similarities = []
-        for i in range(len(embeddings) - 1):
-            sim = cosine_similarity(
-                [embeddings[i]],
-                [embeddings[i + 1]]
-            )[0][0]
-            similarities.append(sim)
+        # Slice of the resume's shared (row-normalised) embedding matrix;
+        # without one (gate already failing), embed just these sentences
+        if data.get("sentence_embeddings") is not None:
+            embeddings = data["sentence_embeddings"][positions]
+        else:
+            embeddings = normalize_rows(encode_texts(sentences))
+
+        # Cosine similarity of each sentence with the next one
+        similarities = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:])
 
         discourse_score = round(float(np.mean(similarities)), 2)
 
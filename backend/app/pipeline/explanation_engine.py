@@ -1,6 +1,5 @@
-import uuid
 from sqlalchemy.orm import Session
-from app.models.explanation import Explanation
+from app.models.resume import Resume
 
 
 def explanation_stage(
@@ -16,12 +15,8 @@ def explanation_stage(
     if not reasons:
         reasons = ["Resume meets all structural and job requirements"]
 
-    for reason in reasons:
-        explanation = Explanation(
-            id=str(uuid.uuid4()),
-            resume_id=resume_id,
-            message=reason
-        )
-        db.add(explanation)
-
+    db.query(Resume).filter(Resume.resume_id == resume_id).update(
+        {Resume.explanations: list(reasons)},
+        synchronize_session=False
+    )
     db.commit()
@@ -0,0 +1,182 @@
+import threading
+
+import numpy as np
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import EMBEDDING_MODEL_NAME
+from app.core.nlp_manager import NLPManager
+from app.models.data_version import DataVersion
+from app.models.resume_features import ResumeFeatures
+from app.pipeline.corpus_index import CorpusEmbeddingIndex
+from app.pipeline.skill_intelligence import annotate_action_verbs
+
+# Unit fields needed by the JD-dependent stages
+UNIT_FIELDS = ("unit_type", "text", "is_fragment", "has_action_verb")
+
+# data_versions row bumped with every write to resume_features
+FEATURES_VERSION_KEY = "resume_features"
+
+
+def save_resume_features(db: Session, resume_id: str, data: dict, quality_score: float):
+    """
+    Persist the JD-independent features of a resume that passed the
+    quality gate (stages 1-10), so it can be re-scored against any JD.
+    """
+    if any("has_action_verb" not in unit for unit in data["units"]):
+        annotate_action_verbs(data)
+
+    embeddings = np.asarray(data["sentence_embeddings"], dtype=np.float16)
+
+    db.merge(ResumeFeatures(
+        resume_id=resume_id,
+        units=[{field: unit.get(field) for field in UNIT_FIELDS} for unit in data["units"]],
+        embedding_dim=int(embeddings.shape[1]),
+        sentence_embeddings=embeddings.tobytes(),
+        entities=data.get("entities", {}),
+        experience_years=data.get("experience_years", 0.0),
+        quality_score=quality_score,
+        timeline_risk_score=data.get("timeline_risk_score", 1.0),
+        embedding_model=NLPManager.embedding_model_key()
+    ))
+    bump_features_version(db)
+    db.commit()
+
+
+def bump_features_version(db: Session):
+    """
+    Increment the resume_features counter. Call in the same transaction as
+    every insert, update or delete of stored features, before the commit.
+    """
+    bump = {DataVersion.version: DataVersion.version + 1}
+    counter = db.query(DataVersion).filter(DataVersion.name == FEATURES_VERSION_KEY)
+    if counter.update(bump, synchronize_session=False):
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(DataVersion(name=FEATURES_VERSION_KEY, version=1))
+    except IntegrityError:
+        # Another writer created the row first
+        counter.update(bump, synchronize_session=False)
+
+
+def current_backend_features():
+    """
+    Filter for stored features whose vectors this process's embedding
+    backend can be compared with. Untagged rows predate the tag and were
+    written by plain torch, so they only match that backend.
+    """
+    key = NLPManager.embedding_model_key()
+    if key == EMBEDDING_MODEL_NAME:
+        return or_(ResumeFeatures.embedding_model == key, ResumeFeatures.embedding_model.is_(None))
+    return ResumeFeatures.embedding_model == key
+
+
+def decode_sentence_embeddings(features: ResumeFeatures) -> np.ndarray:
+    matrix = np.frombuffer(features.sentence_embeddings, dtype=np.float16)
+    return matrix.reshape(-1, features.embedding_dim).astype(np.float32)
+
+
+def load_resume_features(features: ResumeFeatures) -> dict:
+    """Rebuild the pipeline working state needed by stages 11-12."""
+    return {
+        "units": features.units,
+        "sentence_embeddings": decode_sentence_embeddings(features),
+        "entities": features.entities or {},
+        "experience_years": features.experience_years or 0.0,
+        "timeline_risk_score": features.timeline_risk_score if features.timeline_risk_score is not None else 1.0,
+        "quality_score": features.quality_score
+    }
+
+
+# Process-wide rerank corpus: (version, CorpusEmbeddingIndex, scoring
+# fields per resume), rebuilt only when resume_features changes
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def features_version(db: Session) -> int:
+    """
+    Counter bumped by every write to resume_features (bump_features_version);
+    it only goes up, so any change, on any row, gives a new value.
+    """
+    return db.query(DataVersion.version).filter(
+        DataVersion.name == FEATURES_VERSION_KEY
+    ).scalar() or 0
+
+
+def scoring_fields(row) -> dict:
+    """
+    What stages 11-12 read from a stored resume and nothing more: unit
+    text with its action-verb flag, and only whether dates/organisations
+    were found (all score_education looks at).
+    """
+    entities = row.entities or {}
+    return {
+        "units": [
+            {"text": unit["text"], "has_action_verb": bool(unit.get("has_action_verb"))}
+            for unit in row.units
+        ],
+        "entities": {
+            "dates": entities.get("dates", [])[:1],
+            "organizations": entities.get("organizations", [])[:1]
+        },
+        "experience_years": row.experience_years or 0.0,
+        "timeline_risk_score": row.timeline_risk_score if row.timeline_risk_score is not None else 1.0,
+        "quality_score": row.quality_score
+    }
+
+
+def build_rerank_corpus(db: Session) -> tuple:
+    """
+    Stream the stored features (yield_per) into the corpus index and the
+    trimmed scoring fields. Only each resume's float16 sentence rows are
+    held until the single float32 concatenation; stored rows are already
+    unit length, so they are not normalised again.
+    """
+    rows = (
+        db.query(
+            ResumeFeatures.resume_id,
+            ResumeFeatures.units,
+            ResumeFeatures.embedding_dim,
+            ResumeFeatures.sentence_embeddings,
+            ResumeFeatures.entities,
+            ResumeFeatures.experience_years,
+            ResumeFeatures.quality_score,
+            ResumeFeatures.timeline_risk_score
+        )
+        .filter(current_backend_features())
+        .order_by(ResumeFeatures.resume_id)
+        .yield_per(200)
+    )
+
+    segments = []
+    candidates = []
+    for row in rows:
+        matrix = np.frombuffer(row.sentence_embeddings, dtype=np.float16).reshape(-1, row.embedding_dim)
+        positions = [i for i, unit in enumerate(row.units) if unit.get("unit_type") == "sentence"]
+        segments.append((row.resume_id, matrix[positions]))
+        candidates.append(scoring_fields(row))
+
+    return CorpusEmbeddingIndex.from_segments(segments, normalized=True), candidates
+
+
+def get_rerank_corpus(db: Session) -> tuple:
+    """
+    (index, candidates) shared by every /rerank request, candidates aligned
+    with index.resume_ids. Rebuilt first if resume_features has changed.
+    Treat both as read-only.
+    """
+    global _corpus
+
+    version = features_version(db)
+    corpus = _corpus
+    if corpus is not None and corpus[0] == version:
+        return corpus[1], corpus[2]
+
+    with _corpus_lock:
+        if _corpus is None or _corpus[0] != version:
+            _corpus = (version, *build_rerank_corpus(db))
+        return _corpus[1], _corpus[2]
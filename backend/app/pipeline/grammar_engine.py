@@ -1,12 +1,11 @@
-from app.core.nlp_manager import NLPManager
-
-nlp = NLPManager.get_spacy()
-
-
 class GrammarValidationError(Exception):
     pass
 
 
+# Reads dependencies and POS tags from the shared parse
+SPACY_PROFILE = "syntax"
+
+
 def is_valid_sentence(span) -> bool:
     """
     Checks grammatical validity using dependency parsing on a span.
@@ -27,18 +26,16 @@ def is_valid_sentence(span) -> bool:
 
 
 def grammar_stage(data: dict) -> dict:
-    doc = data.get("doc")
-    if not doc:
+    analysis = data.get("analysis")
+    if not analysis:
         raise GrammarValidationError("Parsed doc not available")
 
     valid_count = 0
     total_sentences = 0
     grammar_results = []
 
-    for sent in doc.sents:
+    for sent in analysis.sentences:
         sentence_text = sent.text.strip()
-        if not sentence_text:
-            continue
 
         total_sentences += 1
 
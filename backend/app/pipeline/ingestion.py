@@ -1,38 +1,62 @@
 import os
-from docx import Document
-import pdfplumber
 from app.core.nlp_manager import NLPManager
+from app.core.analyzed_document import AnalyzedDocument
+from app.core.config import SPACY_BATCH_SIZE, SPACY_N_PROCESS, OCR_MIN_PAGE_CHARS
+from app.pipeline.ocr_engine import ocr_pages, pdf_page_count
+from app.pipeline import (
+    segmentation,
+    grammar_engine,
+    semantic_role_engine,
+    section_behavior_engine,
+    skill_intelligence,
+)
 
 
 class IngestionError(Exception):
     pass
 
 
+# The single resume parse runs the union of the profiles of the stages
+# that run on every resume (structure and quality). NER is left out: it
+# runs once on the same Doc when the candidate name lookup or stage 10
+# first needs it (see AnalyzedDocument.ensure), and not at all for a
+# duplicate whose name is known and that the quality gate rejects
+RESUME_PARSE_PROFILES = tuple(sorted({
+    segmentation.SPACY_PROFILE,
+    grammar_engine.SPACY_PROFILE,
+    semantic_role_engine.SPACY_PROFILE,
+    section_behavior_engine.SPACY_PROFILE,
+    skill_intelligence.SPACY_PROFILE,
+}))
+
+
 def extract_text_from_docx(file_path: str) -> str:
+    from docx import Document
+
     doc = Document(file_path)
     return "\n".join([para.text for para in doc.paragraphs])
 
 
 def extract_text_from_pdf(file_path: str) -> str:
-    """Extract text from PDF, with OCR fallback for image-based PDFs"""
-    text = ""
+    """
+    Extract text from PDF. Pages without a usable text layer that contain
+    an image (scans) are OCR'd individually; pages with text, and blank or
+    near-empty pages without images, never are.
+    """
+    import pdfplumber
+
+    page_texts = []
+    image_pages = []
 
     try:
-        # First try regular text extraction
+        # First try regular text extraction, page by page
         with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        # If we got substantial text, return it
-        if text.strip() and len(text.strip()) > 50:
-            return text.strip()
-        
-        # If no text or very little text, try OCR
-        print("[Ingestion] No text found, attempting OCR...")
-        return extract_text_with_ocr(file_path)
-        
+            for number, page in enumerate(pdf.pages, start=1):
+                text = (page.extract_text() or "").strip()
+                page_texts.append(text)
+                if len(text) < OCR_MIN_PAGE_CHARS and page.images:
+                    image_pages.append(number)
+
     except Exception as e:
         print(f"[Ingestion] PDF extraction error: {e}")
         # Try OCR as fallback
@@ -42,27 +66,27 @@ def extract_text_from_pdf(file_path: str) -> str:
             print(f"[Ingestion] OCR also failed: {ocr_error}")
             return ""
 
+    if image_pages:
+        print(f"[Ingestion] {len(image_pages)}/{len(page_texts)} pages are images without a text layer, attempting OCR...")
+        try:
+            for number, text in ocr_pages(file_path, image_pages).items():
+                page_texts[number - 1] = text.strip()
+        except ImportError:
+            # Keep whatever the text layer gave; an empty result is reported upstream
+            print("[Ingestion] OCR libraries not installed, skipping image-only pages")
+        except Exception as ocr_error:
+            print(f"[Ingestion] OCR failed: {ocr_error}")
+
+    return "\n".join(text for text in page_texts if text).strip()
+
 
 def extract_text_with_ocr(file_path: str) -> str:
-    """Extract text from image-based PDF using OCR"""
+    """Extract text from image-based PDF using OCR (every page, up to the page cap)"""
     try:
-        from pdf2image import convert_from_path
-        import pytesseract
-        
-        print("[Ingestion] Converting PDF to images...")
-        # Convert PDF to images
-        images = convert_from_path(file_path, dpi=300)
-        
-        text = ""
-        print(f"[Ingestion] Running OCR on {len(images)} pages...")
-        for i, image in enumerate(images):
-            # Extract text from each page image
-            page_text = pytesseract.image_to_string(image, lang='eng')
-            text += page_text + "\n"
-            print(f"[Ingestion] Page {i+1}/{len(images)} processed")
-        
-        return text.strip()
-        
+        page_count = pdf_page_count(file_path)
+        texts = ocr_pages(file_path, list(range(1, page_count + 1)))
+        return "\n".join(texts[number].strip() for number in sorted(texts)).strip()
+
     except ImportError as e:
         raise IngestionError(
             "OCR libraries not installed. Install with: pip install pdf2image pytesseract pillow\n"
@@ -72,7 +96,7 @@ def extract_text_with_ocr(file_path: str) -> str:
         raise IngestionError(f"OCR extraction failed: {str(e)}")
 
 
-def ingestion_stage(file_path: str) -> dict:
+def extract_resume_text(file_path: str) -> str:
     if not os.path.exists(file_path):
         raise IngestionError("File not found")
 
@@ -101,15 +125,75 @@ def ingestion_stage(file_path: str) -> dict:
 
     print(f"[Ingestion] Extracted length: {len(cleaned_text)}")
 
+    return cleaned_text
+
+
+def build_ingestion_data(file_path: str, cleaned_text: str, doc) -> dict:
+    return {
+        "file_path": file_path,
+        "raw_text": cleaned_text,
+        "doc": doc,
+        "analysis": AnalyzedDocument(doc, RESUME_PARSE_PROFILES)
+    }
+
+
+def ingestion_stage(file_path: str) -> dict:
+    cleaned_text = extract_resume_text(file_path)
+
     # -------- NLP Parsing (Single Parse Only) --------
     try:
-        nlp = NLPManager.get_spacy()
-        doc = nlp(cleaned_text)
+        doc = NLPManager.parse(cleaned_text, *RESUME_PARSE_PROFILES)
     except Exception as e:
         raise IngestionError(f"NLP parsing failed: {str(e)}")
 
-    return {
-        "file_path": file_path,
-        "raw_text": cleaned_text,
-        "doc": doc
-    }
\ No newline at end of file
+    return build_ingestion_data(file_path, cleaned_text, doc)
+
+
+def ingestion_batch_stage(file_paths: list) -> list:
+    """
+    Batch variant of ingestion_stage.
+
+    Extracts text per file, then parses every readable resume with a single
+    nlp.pipe call. Returns one entry per input path: the ingestion dict, or
+    the IngestionError raised for that file.
+    """
+    results = []
+    texts = []
+    positions = []
+
+    for file_path in file_paths:
+        try:
+            texts.append(extract_resume_text(file_path))
+            positions.append(len(results))
+            results.append(None)
+        except IngestionError as e:
+            results.append(e)
+
+    if not texts:
+        return results
+
+    # -------- NLP Parsing (one pipe for the whole batch) --------
+    try:
+        docs = list(NLPManager.parse_many(
+            texts,
+            *RESUME_PARSE_PROFILES,
+            batch_size=SPACY_BATCH_SIZE,
+            n_process=SPACY_N_PROCESS
+        ))
+    except Exception as e:
+        # Fall back to per-document parsing so one bad text cannot fail the batch
+        print(f"[Ingestion] Batch parse failed ({e}), parsing individually")
+        docs = []
+        for text in texts:
+            try:
+                docs.append(NLPManager.parse(text, *RESUME_PARSE_PROFILES))
+            except Exception as doc_error:
+                docs.append(IngestionError(f"NLP parsing failed: {str(doc_error)}"))
+
+    for position, text, doc in zip(positions, texts, docs):
+        if isinstance(doc, Exception):
+            results[position] = doc
+        else:
+            results[position] = build_ingestion_data(file_paths[position], text, doc)
+
+    return results
@@ -0,0 +1,153 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+from app.core.config import JD_CACHE_SIZE, JD_CACHE_TTL_SECONDS
+from app.core.nlp_manager import NLPManager
+from app.database import SessionLocal
+from app.models.compiled_jd import CompiledJD
+from app.pipeline.jd_intelligence import jd_stage
+
+# Bump when jd_stage output changes so stale DB rows are recompiled
+JD_COMPILER_VERSION = 2  # 2: word-boundary skill matching
+
+
+def compute_jd_hash(jd_text: str) -> str:
+    return hashlib.md5(jd_text.encode()).hexdigest()[:16]
+
+
+class CompiledJDCache:
+    """Thread-safe in-process LRU with a per-entry TTL."""
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, jd_hash: str):
+        with self._lock:
+            entry = self._entries.get(jd_hash)
+            if entry is None:
+                return None
+
+            stored_at, jd_data = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[jd_hash]
+                return None
+
+            self._entries.move_to_end(jd_hash)
+            return jd_data
+
+    def put(self, jd_hash: str, jd_data: dict):
+        with self._lock:
+            self._entries[jd_hash] = (time.monotonic(), jd_data)
+            self._entries.move_to_end(jd_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+jd_cache = CompiledJDCache(JD_CACHE_SIZE, JD_CACHE_TTL_SECONDS)
+
+# One lock per jd_hash so concurrent batches for the same JD compile it
+# once. Entries are [lock, holders] and go away with their last holder, so
+# the map only ever holds JDs being compiled right now.
+_compile_locks = {}
+_compile_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _compile_lock(jd_hash: str):
+    with _compile_locks_guard:
+        entry = _compile_locks.setdefault(jd_hash, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _compile_locks_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _compile_locks[jd_hash]
+
+
+def _load_from_db(jd_hash: str):
+    db = SessionLocal()
+    try:
+        row = db.query(CompiledJD).filter(CompiledJD.jd_hash == jd_hash).first()
+        if not row or row.compiler_version != JD_COMPILER_VERSION:
+            return None
+        # A JD embedded by another backend/model must not meet this one's vectors
+        if row.embedding_model != NLPManager.embedding_model_key():
+            return None
+
+        return {
+            "mandatory_skills": row.mandatory_skills or [],
+            "optional_skills": row.optional_skills or [],
+            "experience_range": row.experience_range,
+            "education_required": bool(row.education_required),
+            "jd_embedding": np.frombuffer(row.jd_embedding, dtype=np.float32)
+        }
+    except Exception as e:
+        print(f"[JD Cache] DB read failed for {jd_hash}: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def _save_to_db(jd_hash: str, jd_data: dict):
+    db = SessionLocal()
+    try:
+        db.merge(CompiledJD(
+            jd_hash=jd_hash,
+            compiler_version=JD_COMPILER_VERSION,
+            mandatory_skills=jd_data["mandatory_skills"],
+            optional_skills=jd_data["optional_skills"],
+            experience_range=jd_data["experience_range"],
+            education_required=jd_data["education_required"],
+            jd_embedding=np.asarray(jd_data["jd_embedding"], dtype=np.float32).tobytes(),
+            embedding_model=NLPManager.embedding_model_key()
+        ))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"[JD Cache] DB write failed for {jd_hash}: {e}")
+    finally:
+        db.close()
+
+
+def get_compiled_jd(jd_text: str, jd_hash: str = None) -> dict:
+    """
+    Return the compiled JD (skills, experience range, education flag and
+    embedding) for jd_text. Looks in the in-process LRU first, then the
+    compiled_jds table, and only runs jd_stage on a miss in both.
+    """
+    if jd_hash is None:
+        jd_hash = compute_jd_hash(jd_text)
+
+    jd_data = jd_cache.get(jd_hash)
+    if jd_data is not None:
+        return jd_data
+
+    with _compile_lock(jd_hash):
+        jd_data = jd_cache.get(jd_hash)
+        if jd_data is not None:
+            return jd_data
+
+        jd_data = _load_from_db(jd_hash)
+        if jd_data is None:
+            print(f"[JD Cache] Compiling JD {jd_hash}")
+            jd_data = jd_stage(jd_text)
+            jd_data["jd_embedding"] = np.asarray(jd_data["jd_embedding"], dtype=np.float32)
+            _save_to_db(jd_hash, jd_data)
+
+        jd_cache.put(jd_hash, jd_data)
+        return jd_data
@@ -1,12 +1,15 @@
 import re
 from app.core.nlp_manager import NLPManager
-
-model = NLPManager.get_sentence_transformer()
-nlp = NLPManager.get_spacy()
+from app.core.embeddings import encode_texts
+from app.pipeline.skill_matcher import SkillMatcher
 
 class JDIntelligenceError(Exception):
     pass
 
+
+# Skill extraction needs noun chunks and POS tags only (no NER or lemmas)
+SPACY_PROFILE = "syntax"
+
 EDU_KEYWORDS = {
     "b.tech", "bachelor", "degree", "computer science", 
     "engineering", "master", "phd", "diploma"
@@ -207,7 +210,7 @@ OPTIONAL_SECTIONS = {"preferred qualifications", "nice to have", "bonus", "prefe
                      "what makes you stand out", "ideal candidate", "plus"}
 
 def extract_skills_from_jd(text: str) -> list:
-    doc = nlp(text)
+    doc = NLPManager.parse(text, SPACY_PROFILE)
     skills = set()
 
     # Extract noun chunks (multi-word technical terms)
@@ -226,8 +229,11 @@ def extract_skills_from_jd(text: str) -> list:
     
     return list(skills)
 
-def classify_skills_by_section(jd_text: str, all_skills: list) -> tuple:
+def classify_skills_by_section(jd_text: str, all_skills: list, matcher: SkillMatcher = None) -> tuple:
     """Classify skills based on section headers and context"""
+    if matcher is None:
+        matcher = SkillMatcher(all_skills)
+
     text_lower = jd_text.lower()
     lines = jd_text.split('\n')
     
@@ -248,23 +254,22 @@ def classify_skills_by_section(jd_text: str, all_skills: list) -> tuple:
             current_section = "optional"
             continue
         
-        # Check if any skills appear in this line
-        for skill in all_skills:
-            if skill in line_lower:
-                if current_section == "mandatory":
+        # Check if any skills appear in this line (single automaton pass)
+        for skill in matcher.skills_in(line_lower):
+            if current_section == "mandatory":
+                if skill not in mandatory_skills:
+                    mandatory_skills.append(skill)
+            elif current_section == "optional":
+                if skill not in optional_skills:
+                    optional_skills.append(skill)
+            else:
+                # Check for mandatory/optional keywords in the line
+                if any(word in line_lower for word in MANDATORY_WORDS):
                     if skill not in mandatory_skills:
                         mandatory_skills.append(skill)
-                elif current_section == "optional":
+                elif any(word in line_lower for word in OPTIONAL_WORDS):
                     if skill not in optional_skills:
                         optional_skills.append(skill)
-                else:
-                    # Check for mandatory/optional keywords in the line
-                    if any(word in line_lower for word in MANDATORY_WORDS):
-                        if skill not in mandatory_skills:
-                            mandatory_skills.append(skill)
-                    elif any(word in line_lower for word in OPTIONAL_WORDS):
-                        if skill not in optional_skills:
-                            optional_skills.append(skill)
     
     # If a skill wasn't classified, default to optional
     for skill in all_skills:
@@ -278,13 +283,15 @@ def jd_stage(jd_text: str = None) -> dict:
         raise JDIntelligenceError("Job description text not provided")
 
     text = jd_text.lower()
-    doc = nlp(jd_text)
 
     # extract all skills dynamically from JD
     all_skills = extract_skills_from_jd(jd_text)
 
+    # one matcher per JD, reused by classification, skill intelligence and scoring
+    matcher = SkillMatcher(all_skills)
+
     # classify skills based on sections
-    mandatory_skills, optional_skills = classify_skills_by_section(jd_text, all_skills)
+    mandatory_skills, optional_skills = classify_skills_by_section(jd_text, all_skills, matcher)
 
     # experience range
     exp_range = None
@@ -299,7 +306,7 @@ def jd_stage(jd_text: str = None) -> dict:
     education_required = any(k in text for k in EDU_KEYWORDS)
 
     # embedding
-    jd_embedding = model.encode(jd_text)
+    jd_embedding = encode_texts([jd_text])[0]
 
     print(f"[JD] Mandatory skills: {mandatory_skills[:5]}")
     print(f"[JD] Optional skills: {optional_skills[:5]}")
@@ -309,5 +316,6 @@ def jd_stage(jd_text: str = None) -> dict:
         "optional_skills": list(set(optional_skills)),
         "experience_range": exp_range,
         "education_required": education_required,
-        "jd_embedding": jd_embedding
+        "jd_embedding": jd_embedding,
+        "skill_matcher": matcher
     }
\ No newline at end of file
@@ -1,8 +1,7 @@
 import numpy as np
-from sentence_transformers import util
 
-from app.core.nlp_manager import NLPManager
-model = NLPManager.get_sentence_transformer()
+from app.pipeline.sentence_embeddings import sentence_embedding_stage
+from app.pipeline.skill_matcher import get_skill_matcher
 
 
 class MatchingEngineError(Exception):
@@ -20,6 +19,7 @@ def score_skills(skill_confidence: dict, jd_data: dict) -> float:
 
     mandatory_score = 0.0
     if mandatory:
+        matcher = get_skill_matcher(jd_data)
         matched_count = 0
         total_confidence = 0.0
         
@@ -33,9 +33,11 @@ def score_skills(skill_confidence: dict, jd_data: dict) -> float:
                 boosted_confidence = min(confidence * 2.0, 1.0)
                 total_confidence += boosted_confidence
             else:
-                # Check for partial matches (e.g., "node" for "node.js")
+                # Check for partial matches (e.g., "node" for "node.js"),
+                # precomputed once per JD by the skill matcher
+                related = matcher.related_skills(skill)
                 for resume_skill in skill_confidence.keys():
-                    if skill in resume_skill or resume_skill in skill:
+                    if resume_skill in related:
                         matched_count += 1
                         total_confidence += min(skill_confidence[resume_skill] * 1.5, 1.0)
                         break
@@ -104,40 +106,43 @@ def score_education(education_required: bool, entities: dict) -> float:
         return 0.6  # Give some credit even if not clearly detected
 
 
-def score_semantic_similarity(units: list, jd_embedding) -> float:
-    sentences = [
-        u["text"] for u in units
+def score_semantic_similarity(units: list, jd_embedding, sentence_embeddings=None) -> float:
+    """
+    Mean of the top-3 cosine similarities between the resume's sentences
+    and the JD, computed on the resume's shared (row-normalised) matrix.
+    """
+    positions = [
+        i for i, u in enumerate(units)
         if u.get("unit_type") == "sentence"
     ]
 
-    if not sentences:
+    if not positions or sentence_embeddings is None:
         return 0.0
 
-    resume_embeddings = model.encode(sentences)
-
-    similarities = util.cos_sim(resume_embeddings, jd_embedding)
-
-    # Flatten to 1D safely
-    similarities = similarities.squeeze()
-
-    if similarities.ndim == 0:
-        return float(similarities)
-
-    num_sentences = similarities.shape[0]
-
-    if num_sentences == 0:
+    jd_vector = np.asarray(jd_embedding, dtype=np.float32).ravel()
+    jd_norm = np.linalg.norm(jd_vector)
+    if jd_norm == 0:
         return 0.0
 
-    k = min(3, num_sentences)
+    similarities = sentence_embeddings[positions] @ (jd_vector / jd_norm)
+
+    k = min(3, similarities.shape[0])
 
-    top_k_values, _ = similarities.topk(k)
+    top_k_values = np.partition(similarities, -k)[-k:]
 
     return float(top_k_values.mean())
 
 
 
-def matching_stage(data: dict, jd_data: dict):
+def matching_stage(data: dict, jd_data: dict, semantic_score: float = None):
+    """
+    semantic_score can be supplied by callers that scored many resumes at
+    once (see CorpusEmbeddingIndex); otherwise it is computed here.
+    """
     try:
+        if semantic_score is None and data.get("units") and data.get("sentence_embeddings") is None:
+            sentence_embedding_stage(data)
+
         skill_score = score_skills(
             data.get("skill_confidence", {}),
             jd_data
@@ -153,10 +158,12 @@ def matching_stage(data: dict, jd_data: dict):
             data.get("entities", {})
         )
 
-        semantic_score = score_semantic_similarity(
-            data.get("units", []),
-            jd_data["jd_embedding"]
-        )
+        if semantic_score is None:
+            semantic_score = score_semantic_similarity(
+                data.get("units", []),
+                jd_data["jd_embedding"],
+                data.get("sentence_embeddings")
+            )
 
         final_score = (
             0.40 * skill_score +
@@ -1,12 +1,14 @@
 import re
-from app.core.nlp_manager import NLPManager
-nlp = NLPManager.get_spacy()
 
 
 class NERError(Exception):
     pass
 
 
+# Reads entities from the shared parse
+SPACY_PROFILE = "entities"
+
+
 EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
 PHONE_PATTERN = r"(\+?\d{1,3}[\s-]?)?\d{10}"
 EXPERIENCE_PATTERN = r"(\d+(\.\d+)?)\s*(\+)?\s*years?"
@@ -38,26 +40,24 @@ def ner_stage(data: dict) -> dict:
     if not units:
         raise NERError("No units available for NER")
 
+    analysis = data.get("analysis")
+    if not analysis:
+        raise NERError("Parsed doc not available")
+
+    # The resume parse skips ner; run it on the same Doc unless the name
+    # lookup already did
+    analysis.ensure(SPACY_PROFILE)
+
     full_text = " ".join(u["text"] for u in units)
 
     # ---------- Regex-based ----------
     emails = re.findall(EMAIL_PATTERN, full_text)
     phones = re.findall(PHONE_PATTERN, full_text)
 
-    # ---------- spaCy NER ----------
-    doc = nlp(full_text)
-
-    names = []
-    organizations = []
-    dates = []
-
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            names.append(ent.text)
-        elif ent.label_ == "ORG":
-            organizations.append(ent.text)
-        elif ent.label_ == "DATE":
-            dates.append(ent.text)
+    # ---------- spaCy NER (shared parse) ----------
+    names = analysis.entities("PERSON")
+    organizations = analysis.entities("ORG")
+    dates = analysis.entities("DATE")
 
     # ---------- Experience ----------
     experience_years = extract_experience_years(
@@ -0,0 +1,118 @@
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import OCR_DPI, OCR_MAX_PAGES, OCR_MAX_WORKERS
+
+_ocr_pool = None
+_ocr_pool_lock = threading.Lock()
+# Cross-process: created by the parent and handed to executor workers, so
+# OCR_MAX_WORKERS bounds pages in flight across the whole process tree
+_ocr_slots = None
+
+
+def require_ocr_libraries():
+    """Raise ImportError here, not in a worker, when OCR is not installed."""
+    import pdf2image  # noqa: F401
+    import pytesseract  # noqa: F401
+
+
+def pdf_page_count(file_path: str) -> int:
+    from pdf2image import pdfinfo_from_path
+
+    return int(pdfinfo_from_path(file_path)["Pages"])
+
+
+def get_ocr_slots():
+    """Semaphore with OCR_MAX_WORKERS slots, one per page being OCR'd."""
+    global _ocr_slots
+    if _ocr_slots is None:
+        with _ocr_pool_lock:
+            if _ocr_slots is None:
+                # spawn context: safe to hand to fork, forkserver and spawn workers
+                _ocr_slots = multiprocessing.get_context("spawn").BoundedSemaphore(OCR_MAX_WORKERS)
+    return _ocr_slots
+
+
+def set_ocr_slots(slots):
+    """Executor workers adopt the parent's semaphore (see executor._init_process_worker)."""
+    global _ocr_slots
+    _ocr_slots = slots
+
+
+def ocr_page(file_path: str, page_number: int, dpi: int = OCR_DPI) -> str:
+    """
+    Rasterise and recognise a single page (1-based).
+
+    Only this page is rendered, so a slot holds one bitmap at a time
+    instead of the whole document.
+    """
+    from pdf2image import convert_from_path
+    import pytesseract
+
+    with get_ocr_slots():
+        images = convert_from_path(file_path, dpi=dpi, first_page=page_number, last_page=page_number)
+        try:
+            return "\n".join(pytesseract.image_to_string(image, lang="eng") for image in images)
+        finally:
+            for image in images:
+                image.close()
+
+
+def get_ocr_pool() -> ThreadPoolExecutor:
+    """
+    Threads for OCR work, created on first use.
+
+    pdftoppm and tesseract run as subprocesses, so threads are enough for
+    pages to run in parallel; no extra Python processes are started, and
+    the shared semaphore (not the pool size) limits concurrent pages.
+    """
+    global _ocr_pool
+    if _ocr_pool is None:
+        with _ocr_pool_lock:
+            if _ocr_pool is None:
+                _ocr_pool = ThreadPoolExecutor(max_workers=OCR_MAX_WORKERS, thread_name_prefix="ocr")
+    return _ocr_pool
+
+
+def shutdown_ocr_pool(wait: bool = False):
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is not None:
+            _ocr_pool.shutdown(wait=wait)
+            _ocr_pool = None
+
+
+def ocr_pages(file_path: str, page_numbers: list, dpi: int = OCR_DPI) -> dict:
+    """
+    OCR the given 1-based pages in parallel, at most OCR_MAX_WORKERS pages
+    at a time across the API process and its executor workers.
+
+    At most OCR_MAX_PAGES pages are recognised. A page that fails is
+    logged and left out. Returns {page_number: text}.
+    """
+    require_ocr_libraries()
+
+    pages = list(page_numbers)[:OCR_MAX_PAGES]
+    if len(pages) < len(page_numbers):
+        print(f"[OCR] Page cap reached: OCR'ing {len(pages)} of {len(page_numbers)} image-only pages")
+
+    if not pages:
+        return {}
+
+    # One page is not worth a round trip to the pool
+    if len(pages) == 1:
+        return {pages[0]: ocr_page(file_path, pages[0], dpi)}
+
+    print(f"[OCR] Running OCR on {len(pages)} pages (up to {OCR_MAX_WORKERS} at a time, {dpi} DPI)...")
+    pool = get_ocr_pool()
+    futures = {page: pool.submit(ocr_page, file_path, page, dpi) for page in pages}
+
+    results = {}
+    for page, future in futures.items():
+        try:
+            results[page] = future.result()
+        except Exception as e:
+            print(f"[OCR] Page {page} failed: {e}")
+
+    return results
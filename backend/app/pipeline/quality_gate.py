@@ -9,6 +9,48 @@ MIN_OVERALL_QUALITY_SCORE = 0.45
 MAX_FRAGMENT_RATIO = 0.60
 
 
+def weighted_quality_score(data: dict, discourse: float) -> float:
+    grammar = data.get("grammar_score", 0)
+    semantic = data.get("semantic_role_score", 0)
+    section = data.get("section_behavior_score", 0)
+    timeline = data.get("timeline_risk_score", 0)
+    fragment_ratio = data.get("fragment_ratio", 0)
+
+    # ---------- Fragment penalty ----------
+    fragment_penalty = 0.0
+    if fragment_ratio > MAX_FRAGMENT_RATIO:
+        fragment_penalty = (fragment_ratio - MAX_FRAGMENT_RATIO)
+
+    # ---------- Weighted score ----------
+    quality_score = (
+        0.25 * grammar +
+        0.25 * semantic +
+        0.20 * section +
+        0.20 * discourse +
+        0.10 * timeline -
+        fragment_penalty
+    )
+    return round(max(quality_score, 0.0), 2)
+
+
+def quality_gate_fails_early(data: dict) -> bool:
+    """
+    Incremental check on the cheap signals (grammar, semantic roles,
+    section behavior, consistency), before discourse is known.
+
+    True when the gate is certain to reject: a hard rule already fails,
+    or the weighted score stays below the threshold even with a perfect
+    discourse score (cosine similarity is at most 1).
+    """
+    if data.get("grammar_score", 0) < MIN_GRAMMAR_SCORE:
+        return True
+
+    if data.get("semantic_role_score", 0) < MIN_SEMANTIC_ROLE_SCORE:
+        return True
+
+    return weighted_quality_score(data, discourse=1.0) < MIN_OVERALL_QUALITY_SCORE
+
+
 def quality_gate_stage(data: dict):
     try:
         grammar = data.get("grammar_score", 0)
@@ -18,22 +60,8 @@ def quality_gate_stage(data: dict):
         timeline = data.get("timeline_risk_score", 0)
         fragment_ratio = data.get("fragment_ratio", 0)
 
-        # ---------- Fragment penalty ----------
-        fragment_penalty = 0.0
-        if fragment_ratio > MAX_FRAGMENT_RATIO:
-            fragment_penalty = (fragment_ratio - MAX_FRAGMENT_RATIO)
-
-        # ---------- Weighted score ----------
-        quality_score = (
-            0.25 * grammar +
-            0.25 * semantic +
-            0.20 * section +
-            0.20 * discourse +
-            0.10 * timeline -
-            fragment_penalty
-        )
         print(f"[QG] grammar={grammar} semantic={semantic} section={section} discourse={discourse} timeline={timeline} fragment={fragment_ratio}")
-        quality_score = round(max(quality_score, 0.0), 2)
+        quality_score = weighted_quality_score(data, discourse)
 
         # ---------- HARD RULES ----------
         is_valid = True
@@ -0,0 +1,110 @@
+from sqlalchemy.orm import Session
+
+from app.core.nlp_manager import NLPManager
+from app.models.engine_score import EngineScore
+from app.models.explanation import Explanation
+from app.models.resume import Resume
+from app.pipeline.jd_cache import JD_COMPILER_VERSION
+
+# (engine name in API payloads, Resume column, matching_stage key)
+ENGINE_SCORE_FIELDS = (
+    ("Skill Match", "skill_match_score", "skill_score"),
+    ("Experience", "experience_score", "experience_score"),
+    ("Education", "education_score", "education_score"),
+    ("Semantic Match", "semantic_score", "semantic_score"),
+)
+# Not stored separately: always quality_score on the 0-100 scale
+QUALITY_GATE_ENGINE = "Quality Gate"
+
+# Everything a results read needs, from the resume row alone
+SCORE_COLUMNS = (
+    Resume.status,
+    Resume.quality_score,
+    Resume.explanations,
+    *[getattr(Resume, column) for _, column, _ in ENGINE_SCORE_FIELDS],
+)
+
+
+def result_versions() -> dict:
+    """Besides the bytes and the JD text, what a stored result depends on."""
+    return {
+        "jd_compiler_version": JD_COMPILER_VERSION,
+        "embedding_model": NLPManager.embedding_model_key(),
+    }
+
+
+def stamp_result_versions(resume: Resume):
+    for column, value in result_versions().items():
+        setattr(resume, column, value)
+
+
+def has_current_versions(row) -> bool:
+    return all(getattr(row, column) == value for column, value in result_versions().items())
+
+
+def store_result_scores(resume: Resume, final_score_data: dict):
+    """
+    Engine scores and reasons go on the resume row, so they are written by
+    the same UPDATE as the decision (no per-engine or per-reason rows).
+    """
+    for _, column, key in ENGINE_SCORE_FIELDS:
+        setattr(resume, column, round(final_score_data.get(key, 0) * 100, 2))
+    resume.explanations = list(final_score_data.get("reasons", []))
+
+
+def is_legacy_result(row) -> bool:
+    """Processed before scores moved onto the resume row; still in engine_scores/explanations."""
+    return row.status == "PROCESSED" and row.skill_match_score is None
+
+
+def engine_score_list(row) -> list:
+    """[{engine, score}] in the order the worker has always written them."""
+    if row.skill_match_score is None:
+        return []
+
+    scores = [{"engine": engine, "score": getattr(row, column)} for engine, column, _ in ENGINE_SCORE_FIELDS]
+    scores.append({"engine": QUALITY_GATE_ENGINE, "score": round((row.quality_score or 0) * 100, 2)})
+    return scores
+
+
+def load_legacy_results(db: Session, resume_id: str) -> tuple:
+    scores = [
+        {"engine": e.engine, "score": e.score}
+        for e in db.query(EngineScore).filter(EngineScore.resume_id == resume_id).all()
+    ]
+    explanations = [
+        e.message
+        for e in db.query(Explanation).filter(Explanation.resume_id == resume_id).all()
+    ]
+    return scores, explanations
+
+
+def load_result_scores(db: Session, resume_id: str, *extra_columns) -> tuple:
+    """
+    (engine_scores, explanations, row) for one resume in a single query.
+    Rows written before the compact columns fall back to the old tables.
+    row is None (and the lists empty) if the resume does not exist.
+    """
+    row = db.query(*SCORE_COLUMNS, *extra_columns).filter(Resume.resume_id == resume_id).first()
+    if row is None:
+        return [], [], None
+
+    if is_legacy_result(row):
+        scores, explanations = load_legacy_results(db, resume_id)
+        return scores, explanations, row
+
+    return engine_score_list(row), row.explanations or [], row
+
+
+def copy_result_scores(db: Session, source: Resume, target: Resume):
+    if not is_legacy_result(source):
+        for _, column, _ in ENGINE_SCORE_FIELDS:
+            setattr(target, column, getattr(source, column))
+        target.explanations = source.explanations
+        return
+
+    scores, explanations = load_legacy_results(db, source.resume_id)
+    by_engine = {score["engine"]: score["score"] for score in scores}
+    for engine, column, _ in ENGINE_SCORE_FIELDS:
+        setattr(target, column, by_engine.get(engine))
+    target.explanations = explanations
@@ -1,24 +1,24 @@
 import re
-from app.core.nlp_manager import NLPManager
-nlp = NLPManager.get_spacy()
 
 
 class SectionBehaviorError(Exception):
     pass
 
 
+# Reads POS tag counts from the shared parse
+SPACY_PROFILE = "pos"
+
+
 EDU_KEYWORDS = {
     "bachelor", "master", "b.tech", "m.tech", "degree",
     "university", "college", "education"
 }
 
 
-def analyze_behavior(text: str) -> dict:
-    doc = nlp(text)
-
-    token_count = len(doc)
-    verb_count = sum(1 for t in doc if t.pos_ == "VERB")
-    noun_count = sum(1 for t in doc if t.pos_ in ("NOUN", "PROPN"))
+def analyze_behavior(text: str, pos_tags: list) -> dict:
+    token_count = len(pos_tags)
+    verb_count = sum(1 for pos in pos_tags if pos == "VERB")
+    noun_count = sum(1 for pos in pos_tags if pos in ("NOUN", "PROPN"))
     has_year = bool(re.search(r"\b(19|20)\d{2}\b", text.lower()))
     has_edu_keyword = any(k in text.lower() for k in EDU_KEYWORDS)
 
@@ -44,6 +44,10 @@ def section_behavior_stage(data: dict) -> dict:
     if not units:
         raise SectionBehaviorError("No units available for section behavior analysis")
 
+    analysis = data.get("analysis")
+    if not analysis:
+        raise SectionBehaviorError("Parsed doc not available")
+
     behavior_results = []
     mismatches = 0
     total = 0
@@ -52,14 +56,17 @@ def section_behavior_stage(data: dict) -> dict:
         if unit["unit_type"] != "sentence":
             continue
 
-        analysis = analyze_behavior(unit["text"])
+        behavior = analyze_behavior(
+            unit["text"],
+            analysis.pos_tags(unit["sent_index"])
+        )
         behavior_results.append({
             "text": unit["text"],
-            "behavior": analysis
+            "behavior": behavior
         })
 
         # Fragmented skill lists in experience-like areas
-        if analysis["inferred_section"] == "skills" and analysis["verb_density"] < 0.05:
+        if behavior["inferred_section"] == "skills" and behavior["verb_density"] < 0.05:
             mismatches += 1
 
         total += 1
@@ -1,12 +1,11 @@
-from app.core.nlp_manager import NLPManager
-
-nlp = NLPManager.get_spacy()
-
-
 class SegmentationError(Exception):
     pass
 
 
+# Reads sentence boundaries and POS tags from the shared parse
+SPACY_PROFILE = "syntax"
+
+
 def is_fragment(span) -> bool:
     """
     Detect sentence fragments using POS tags.
@@ -21,25 +20,23 @@ def is_fragment(span) -> bool:
 
 
 def segmentation_stage(data: dict) -> dict:
-    doc = data.get("doc")
-    if not doc:
+    analysis = data.get("analysis")
+    if not analysis:
         raise SegmentationError("Parsed doc not available")
 
     units = []
     fragment_count = 0
 
     # -------- Sentence Segmentation --------
-    for sent in doc.sents:
+    for index, sent in enumerate(analysis.sentences):
         sentence = sent.text.strip()
-        if not sentence:
-            continue
-
         fragment = is_fragment(sent)
 
         units.append({
             "unit_type": "sentence",
             "text": sentence,
-            "is_fragment": fragment
+            "is_fragment": fragment,
+            "sent_index": index
         })
 
         if fragment:
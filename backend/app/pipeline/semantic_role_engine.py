@@ -1,12 +1,11 @@
-from app.core.nlp_manager import NLPManager
-
-nlp = NLPManager.get_spacy()
-
-
 class SemanticRoleError(Exception):
     pass
 
 
+# Reads dependencies, POS tags and lemmas from the shared parse
+SPACY_PROFILE = "roles"
+
+
 ACTION_VERBS_BLACKLIST = {
     "have", "know", "familiar", "experience"
 }
@@ -52,16 +51,16 @@ def analyze_semantic_roles(span) -> dict:
 
 
 def semantic_role_stage(data: dict) -> dict:
-    full_doc = data.get("doc")
+    analysis = data.get("analysis")
 
-    if not full_doc:
+    if not analysis:
         raise SemanticRoleError("No parsed document available")
 
     valid_count = 0
     total_sentences = 0
     role_results = []
 
-    for sent in full_doc.sents:
+    for sent in analysis.sentences:
         sentence_text = sent.text.strip()
 
         # Ignore very short fragments
@@ -0,0 +1,45 @@
+import numpy as np
+
+from app.core.embeddings import encode_texts
+
+
+class SentenceEmbeddingError(Exception):
+    pass
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def sentence_embedding_batch_stage(batch: list) -> list:
+    """
+    Embed every unique sentence across the batch exactly once, with one
+    encode call (cache misses only). Each resume gets "sentence_embeddings": an
+    L2-normalised float32 matrix whose rows line up with its units, so
+    cosine similarity downstream is a plain dot product.
+    """
+    unique_sentences = {}
+    for data in batch:
+        units = data.get("units")
+        if not units:
+            raise SentenceEmbeddingError("No units available for embedding")
+        for unit in units:
+            unique_sentences.setdefault(unit["text"], len(unique_sentences))
+
+    if not unique_sentences:
+        return batch
+
+    embeddings = normalize_rows(encode_texts(list(unique_sentences)))
+
+    for data in batch:
+        rows = [unique_sentences[unit["text"]] for unit in data["units"]]
+        data["sentence_embeddings"] = embeddings[rows]
+
+    return batch
+
+
+def sentence_embedding_stage(data: dict) -> dict:
+    sentence_embedding_batch_stage([data])
+    return data
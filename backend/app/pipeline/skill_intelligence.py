@@ -1,46 +1,59 @@
-from app.core.nlp_manager import NLPManager
-
-nlp = NLPManager.get_spacy()
+from app.pipeline.skill_matcher import get_skill_matcher
 
 class SkillIntelligenceError(Exception):
     pass
 
+# Reads verb lemmas from the shared parse
+SPACY_PROFILE = "verbs"
+
 ACTION_VERBS = {
     "develop", "build", "implement", "design",
     "train", "deploy", "optimize", "analyze", "create",
     "manage", "lead", "engineer", "architect"
 }
 
+def annotate_action_verbs(data: dict) -> dict:
+    """
+    Flag units that use an action verb. The flag is stored on the unit so
+    skill scoring can run later without the parsed document.
+    """
+    analysis = data.get("analysis")
+    if not analysis:
+        raise SkillIntelligenceError("Parsed doc not available")
+
+    for unit in data["units"]:
+        verbs = analysis.verb_lemmas(unit["sent_index"])
+        unit["has_action_verb"] = bool(verbs.intersection(ACTION_VERBS))
+
+    return data
+
+
 def skill_intelligence_stage(data: dict) -> dict:
     units = data.get("units")
     if not units:
         raise SkillIntelligenceError("No units available for skill intelligence")
 
+    if any("has_action_verb" not in unit for unit in units):
+        annotate_action_verbs(data)
+
     # get skills from JD — dynamic now, no hardcoded list
     jd_data = data.get("jd_data", {})
-    all_jd_skills = list(set(
-        jd_data.get("mandatory_skills", []) +
-        jd_data.get("optional_skills", [])
-    ))
+    matcher = get_skill_matcher(jd_data)
 
     skill_stats = {}
 
     for unit in units:
-        text = unit["text"].lower()
-        doc = nlp(text)
-        verbs = {t.lemma_ for t in doc if t.pos_ == "VERB"}
-
-        for skill in all_jd_skills:
-            if skill in text:
-                if skill not in skill_stats:
-                    skill_stats[skill] = {
-                        "frequency": 0,
-                        "action_usage": 0,
-                    }
-                skill_stats[skill]["frequency"] += 1
-
-                if verbs.intersection(ACTION_VERBS):
-                    skill_stats[skill]["action_usage"] += 1
+        # One automaton pass finds every JD skill in the unit
+        for skill in matcher.skills_in(unit["text"]):
+            if skill not in skill_stats:
+                skill_stats[skill] = {
+                    "frequency": 0,
+                    "action_usage": 0,
+                }
+            skill_stats[skill]["frequency"] += 1
+
+            if unit["has_action_verb"]:
+                skill_stats[skill]["action_usage"] += 1
 
     # confidence scoring
     skill_confidence = {}
@@ -0,0 +1,122 @@
+from collections import deque
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over a JD's skill phrases.
+
+    Finds every skill occurring in a text in one linear pass. A match only
+    counts when it is not glued to neighbouring word characters, so "java"
+    does not fire inside "javascript" while "node" still matches "node.js".
+    Skills ending in symbols (c++, c#) are only boundary-checked on their
+    word-character side.
+    """
+
+    def __init__(self, skills: list):
+        self.skills = list(dict.fromkeys(
+            s.lower().strip() for s in skills if s and s.strip()
+        ))
+        self._index = {skill: i for i, skill in enumerate(self.skills)}
+        self._related = None
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for skill_index, skill in enumerate(self.skills):
+            node = 0
+            for ch in skill:
+                next_node = self._goto[node].get(ch)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][ch] = next_node
+                node = next_node
+            self._out[node].append(skill_index)
+
+        # -------- Failure links (BFS) --------
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, next_node in self._goto[node].items():
+                queue.append(next_node)
+
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+
+                self._fail[next_node] = self._goto[fallback].get(ch, 0)
+                self._out[next_node] = self._out[next_node] + self._out[self._fail[next_node]]
+
+    def __len__(self):
+        return len(self.skills)
+
+    @staticmethod
+    def _at_boundary(text: str, start: int, end: int, skill: str) -> bool:
+        if _is_word_char(skill[0]) and start > 0 and _is_word_char(text[start - 1]):
+            return False
+        if _is_word_char(skill[-1]) and end < len(text) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def find_all(self, text: str) -> list:
+        """All (start, end, skill) occurrences in text, in text order."""
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            for skill_index in out[node]:
+                skill = self.skills[skill_index]
+                start = i - len(skill) + 1
+                if self._at_boundary(text, start, i + 1, skill):
+                    matches.append((start, i + 1, skill))
+
+        return matches
+
+    def skills_in(self, text: str) -> list:
+        """Distinct skills present in text, in the order they were given."""
+        found = {skill for _, _, skill in self.find_all(text)}
+        return sorted(found, key=self._index.__getitem__)
+
+    def related_skills(self, skill: str) -> set:
+        """
+        Skills that contain `skill` or are contained in it as whole words
+        (e.g. "node" <-> "node.js"). Computed once per matcher.
+        """
+        if self._related is None:
+            related = {s: set() for s in self.skills}
+            for outer in self.skills:
+                for inner in self.skills_in(outer):
+                    if inner != outer:
+                        related[outer].add(inner)
+                        related[inner].add(outer)
+            self._related = related
+
+        return self._related.get(skill.lower().strip(), set())
+
+
+def get_skill_matcher(jd_data: dict) -> SkillMatcher:
+    """
+    The JD's compiled matcher. jd_stage builds it; compiled JDs loaded from
+    the DB cache get it rebuilt here once and kept on the shared dict.
+    """
+    matcher = jd_data.get("skill_matcher")
+    if matcher is None:
+        matcher = SkillMatcher(
+            jd_data.get("mandatory_skills", []) +
+            jd_data.get("optional_skills", [])
+        )
+        jd_data["skill_matcher"] = matcher
+    return matcher
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.config import MODEL_WARMUP
+from app.core.startup import readiness
+
+router = APIRouter()
+
+
+@router.get("/health/ready")
+def get_readiness():
+    """Database and model load state; 503 until the process can take work"""
+    report = readiness(MODEL_WARMUP)
+    return JSONResponse(content=report, status_code=200 if report["ready"] else 503)
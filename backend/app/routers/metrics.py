@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.core.embeddings import embedding_cache, embedding_service
+from app.workers.job_queue import queue_stats
+from app.workers.resume_dedup import dedup_stats
+
+router = APIRouter()
+
+
+@router.get("/metrics/embedding-cache")
+def get_embedding_cache_metrics():
+    """Hit/miss counters and size of the on-disk sentence embedding cache"""
+    return embedding_cache.stats()
+
+
+@router.get("/metrics/embedding-batcher")
+def get_embedding_batcher_metrics():
+    """Batch fill and wait times of the cross-request embedding micro-batcher"""
+    return embedding_service.stats()
+
+
+@router.get("/metrics/jobs")
+def get_job_queue_metrics():
+    """Queue depth and state counts of the durable job queue"""
+    return queue_stats()
+
+
+@router.get("/metrics/dedup")
+def get_dedup_metrics(db: Session = Depends(get_db)):
+    """Share of uploads that reused earlier results instead of the full pipeline"""
+    return dedup_stats(db)
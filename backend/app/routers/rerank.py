@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.resume import Resume
+from app.models.resume_features import ResumeFeatures
+from app.pipeline.feature_store import get_rerank_corpus
+from app.pipeline.jd_cache import compute_jd_hash, get_compiled_jd
+from app.pipeline.skill_intelligence import skill_intelligence_stage
+from app.pipeline.matching_engine import matching_stage
+
+router = APIRouter()
+
+
+class RerankRequest(BaseModel):
+    jd_text: str
+    limit: int = 100
+
+
+@router.post("/rerank")
+def rerank_stored_resumes(req: RerankRequest, db: Session = Depends(get_db)):
+    """
+    Rank every stored resume against a new JD using the persisted
+    JD-independent features. Only skill intelligence and matching run;
+    nothing is re-uploaded, re-parsed or written back.
+    """
+    if not req.jd_text.strip():
+        raise HTTPException(status_code=400, detail="Job description text not provided")
+
+    jd_hash = compute_jd_hash(req.jd_text)
+    jd_data = get_compiled_jd(req.jd_text, jd_hash)
+
+    # Shared per process; nothing per resume is loaded or decoded here
+    index, candidates = get_rerank_corpus(db)
+    semantic_scores = index.semantic_scores(jd_data["jd_embedding"])
+
+    resumes = {
+        resume_id: (candidate_name, original_jd_hash)
+        for resume_id, candidate_name, original_jd_hash in (
+            db.query(Resume.resume_id, Resume.candidate_name, Resume.jd_hash)
+            .join(ResumeFeatures, ResumeFeatures.resume_id == Resume.resume_id)
+        )
+    }
+
+    ranked = []
+    for resume_id, fields, semantic_score in zip(index.resume_ids, candidates, semantic_scores):
+        if resume_id not in resumes:
+            continue
+        candidate_name, original_jd_hash = resumes[resume_id]
+
+        # Fresh dict per request; the cached fields are only read
+        data = {**fields, "jd_data": jd_data}
+        data = skill_intelligence_stage(data)
+        final_score, final_score_data = matching_stage(data, jd_data, float(semantic_score))
+
+        ranked.append({
+            "resume_id": resume_id,
+            "candidate_name": candidate_name,
+            "original_jd_hash": original_jd_hash,
+            "final_score": final_score,
+            "decision": final_score_data["decision"],
+            "skill_score": round(final_score_data["skill_score"] * 100, 2),
+            "experience_score": round(final_score_data["experience_score"] * 100, 2),
+            "education_score": round(final_score_data["education_score"] * 100, 2),
+            "semantic_score": round(final_score_data["semantic_score"] * 100, 2),
+            "quality_score": data["quality_score"]
+        })
+
+    ranked.sort(key=lambda r: r["final_score"], reverse=True)
+    for rank, entry in enumerate(ranked, start=1):
+        entry["rank"] = rank
+
+    return {
+        "jd_hash": jd_hash,
+        "total": len(ranked),
+        "results": ranked[:max(req.limit, 0)]
+    }
@@ -1,36 +1,40 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.models.engine_score import EngineScore
 from app.models.explanation import Explanation
+from app.models.resume import Resume
+from app.models.resume_features import ResumeFeatures
+from app.pipeline.feature_store import bump_features_version
+from app.pipeline.score_store import SCORE_COLUMNS, engine_score_list, is_legacy_result, load_result_scores
 from fastapi import HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from datetime import datetime
+from itertools import groupby
+import csv
+import io
+import json
 import os
 
 router = APIRouter()
 
+MEDIA_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+}
+
 @router.get("/resumes/results/{resume_id}")
 def get_resume_results(resume_id: str, db: Session = Depends(get_db)):
     from app.models.resume import Resume
     
-    resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
-    
-    engine_scores = db.query(EngineScore).filter(
-        EngineScore.resume_id == resume_id
-    ).all()
-
-    explanations = db.query(Explanation).filter(
-        Explanation.resume_id == resume_id
-    ).all()
+    # One query on the resume row (two more only for pre-compact results)
+    engine_scores, explanations, row = load_result_scores(db, resume_id, Resume.skill_data)
 
     return {
         "resume_id": resume_id,
-        "engine_scores": [
-            {"engine": e.engine, "score": e.score}
-            for e in engine_scores
-        ],
-        "explanations": [e.message for e in explanations],
-        "skill_data": resume.skill_data if resume else None
+        "engine_scores": engine_scores,
+        "explanations": explanations,
+        "skill_data": row.skill_data if row else None
     }
 
 
@@ -46,6 +50,8 @@ def delete_resume(resume_id: str, db: Session = Depends(get_db)):
     # Delete related records
     db.query(EngineScore).filter(EngineScore.resume_id == resume_id).delete()
     db.query(Explanation).filter(Explanation.resume_id == resume_id).delete()
+    if db.query(ResumeFeatures).filter(ResumeFeatures.resume_id == resume_id).delete():
+        bump_features_version(db)
     
     # Delete resume
     db.delete(resume)
@@ -61,6 +67,8 @@ def delete_all_resumes(db: Session = Depends(get_db)):
     # Delete all related records
     db.query(EngineScore).delete()
     db.query(Explanation).delete()
+    db.query(ResumeFeatures).delete()
+    bump_features_version(db)
     db.query(Resume).delete()
     
     db.commit()
@@ -80,10 +88,167 @@ def get_resume_file(resume_id: str):
                 file_path = os.path.join(upload_dir, filename)
                 return FileResponse(
                     file_path,
-                    media_type="application/pdf",
+                    media_type=MEDIA_TYPES.get(os.path.splitext(filename)[1].lower(), "application/pdf"),
                     headers={
                         "Content-Disposition": "inline; filename=" + filename
                     }
                 )
     
     raise HTTPException(status_code=404, detail="Resume file not found")
+
+
+# Engine columns of the CSV export, in order
+EXPORT_ENGINES = ("Skill Match", "Experience", "Education", "Semantic Match")
+EXPORT_CSV_HEADER = [
+    "Resume ID", "Status", "Final Score", "Decision", "Quality Score",
+    *EXPORT_ENGINES, "Explanations"
+]
+EXPORT_CHUNK_ROWS = 500
+
+
+def export_filters(query, jd_hash: str, status: str):
+    if jd_hash:
+        query = query.filter(Resume.jd_hash == jd_hash)
+    if status:
+        query = query.filter(Resume.status == status)
+    return query
+
+
+def merge_by_resume(resumes, *children):
+    """
+    Merge-join resume rows with child row streams (each (resume_id, ...)).
+
+    Every stream is ordered by resume_id and the children are joined to
+    the same filtered resumes, so each child group belongs to the current
+    resume or a later one; equality is the only comparison needed. Yields
+    (resume, [child rows per stream]) with one resume's children in memory.
+    """
+    groups = [groupby(rows, key=lambda row: row[0]) for rows in children]
+    current = [next(group, None) for group in groups]
+
+    for resume in resumes:
+        matched = []
+        for i, group in enumerate(groups):
+            if current[i] is not None and current[i][0] == resume.resume_id:
+                matched.append(list(current[i][1]))
+                current[i] = next(group, None)
+            else:
+                matched.append([])
+        yield resume, matched
+
+
+def export_records(jd_hash: str, status: str):
+    """
+    One dict per resume with its engine scores and explanations, in three
+    streamed queries. Scores and reasons come with the resume row; the
+    engine_scores/explanations streams only carry results written before
+    they moved there. Each stream gets its own session (connection),
+    since a connection can only stream one unbuffered result at a time.
+    """
+    sessions = [SessionLocal() for _ in range(3)]
+    try:
+        resume_db, score_db, explanation_db = sessions
+        resumes = export_filters(
+            resume_db.query(
+                Resume.resume_id,
+                Resume.candidate_name,
+                Resume.display_id,
+                Resume.jd_hash,
+                Resume.final_score,
+                Resume.decision,
+                *SCORE_COLUMNS
+            ),
+            jd_hash, status
+        ).order_by(Resume.resume_id).yield_per(EXPORT_CHUNK_ROWS)
+
+        scores = export_filters(
+            score_db.query(EngineScore.resume_id, EngineScore.engine, EngineScore.score)
+            .join(Resume, Resume.resume_id == EngineScore.resume_id),
+            jd_hash, status
+        ).order_by(EngineScore.resume_id).yield_per(EXPORT_CHUNK_ROWS)
+
+        explanations = export_filters(
+            explanation_db.query(Explanation.resume_id, Explanation.message)
+            .join(Resume, Resume.resume_id == Explanation.resume_id),
+            jd_hash, status
+        ).order_by(Explanation.resume_id, Explanation.id).yield_per(EXPORT_CHUNK_ROWS)
+
+        for resume, (resume_scores, resume_explanations) in merge_by_resume(resumes, scores, explanations):
+            if is_legacy_result(resume):
+                engine_scores = {row.engine: row.score for row in resume_scores}
+                reasons = [row.message for row in resume_explanations]
+            else:
+                engine_scores = {score["engine"]: score["score"] for score in engine_score_list(resume)}
+                reasons = resume.explanations or []
+
+            yield {
+                "resume_id": resume.resume_id,
+                "candidate_name": resume.candidate_name,
+                "display_id": resume.display_id,
+                "jd_hash": resume.jd_hash,
+                "status": resume.status,
+                "final_score": resume.final_score,
+                "decision": resume.decision,
+                "quality_score": resume.quality_score,
+                "engine_scores": engine_scores,
+                "explanations": reasons
+            }
+    finally:
+        for db in sessions:
+            db.close()
+
+
+def csv_lines(records):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow(EXPORT_CSV_HEADER)
+    yield flush()
+
+    for record in records:
+        quality = record["quality_score"]
+        writer.writerow([
+            record["resume_id"],
+            record["status"],
+            record["final_score"] if record["final_score"] is not None else "",
+            record["decision"] or "",
+            f"{quality * 100:.2f}" if quality else "",
+            *[record["engine_scores"].get(engine, "") for engine in EXPORT_ENGINES],
+            "; ".join(record["explanations"])
+        ])
+        yield flush()
+
+
+def ndjson_lines(records):
+    for record in records:
+        yield json.dumps(record) + "\n"
+
+
+@router.get("/resumes/export")
+def export_resume_results(format: str = "csv", jd_hash: str = None, status: str = None):
+    """
+    Every matching resume with its engine scores and explanations, as CSV
+    or NDJSON, streamed row by row. Three queries whatever the number of
+    resumes, and server memory stays flat.
+    """
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+
+    records = export_records(jd_hash, status)
+    if format == "csv":
+        body, media_type = csv_lines(records), "text/csv"
+    else:
+        body, media_type = ndjson_lines(records), "application/x-ndjson"
+
+    filename = f"resume_results_{datetime.utcnow().date().isoformat()}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
@@ -1,36 +1,222 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+import asyncio
+import base64
+import hashlib
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, undefer
+from starlette.concurrency import run_in_threadpool
+from app.database import get_db, SessionLocal
 from app.models.resume import Resume
+from app.core.config import (
+    STATUS_SINCE_OVERLAP_SECONDS,
+    STATUS_STREAM_INTERVAL_SECONDS,
+    STATUS_STREAM_HEARTBEAT_SECONDS,
+    STATUS_STREAM_MAX_SECONDS,
+)
 
 router = APIRouter()
 
+FINAL_STATUSES = ("PROCESSED", "INVALID_RESUME", "ERROR")
+
+# Only what the dashboard needs to render a status transition
+STREAM_COLUMNS = (
+    Resume.resume_id,
+    Resume.display_id,
+    Resume.candidate_name,
+    Resume.status,
+    Resume.quality_score,
+    Resume.final_score,
+    Resume.decision,
+    Resume.error_message,
+    Resume.updated_at,
+)
+
+
+def status_rows(db: Session, resume_ids: list, jd_hash: str, since: datetime = None) -> list:
+    """Compact status projection; one query on the primary key or the jd_hash index."""
+    query = db.query(*STREAM_COLUMNS)
+    if resume_ids:
+        query = query.filter(Resume.resume_id.in_(resume_ids))
+    else:
+        query = query.filter(Resume.jd_hash == jd_hash)
+    if since is not None:
+        query = query.filter(Resume.updated_at >= since)
+
+    return [
+        {
+            **row._mapping,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None
+        }
+        for row in query.order_by(Resume.resume_id).all()
+    ]
+
+# Columns /resumes can return; ?fields= picks a subset (default: all)
+LISTABLE_FIELDS = {
+    "resume_id": Resume.resume_id,
+    "candidate_name": Resume.candidate_name,
+    "display_id": Resume.display_id,
+    "jd_hash": Resume.jd_hash,
+    "status": Resume.status,
+    "quality_score": Resume.quality_score,
+    "final_score": Resume.final_score,
+    "decision": Resume.decision,
+    "error_message": Resume.error_message,
+    "skill_data": Resume.skill_data,
+    "upload_time": Resume.upload_time,
+}
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(upload_time: datetime, resume_id: str) -> str:
+    raw = f"{upload_time.isoformat() if upload_time else ''}|{resume_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        upload_time, resume_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(upload_time), resume_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/resumes")
-def get_all_resumes(db: Session = Depends(get_db)):
-    """Get all resumes from database"""
-    resumes = db.query(Resume).order_by(Resume.upload_time.desc()).all()
-    
+def get_all_resumes(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None,
+    status: str = None,
+    decision: str = None,
+    jd_hash: str = None,
+    min_score: float = None,
+    max_score: float = None,
+    fields: str = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Resumes newest first, one page at a time.
+
+    Keyset pagination on (upload_time, resume_id): pass the returned
+    next_cursor to get the following page, so every page costs the same
+    however many rows come before it. Optional filters (status,
+    decision, jd_hash, final score range) and a comma-separated field
+    projection.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    selected = list(LISTABLE_FIELDS)
+    if fields:
+        selected = [name for name in fields.split(",") if name]
+        unknown = [name for name in selected if name not in LISTABLE_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    # The keyset columns are always read, even if not returned
+    columns = [LISTABLE_FIELDS[name] for name in selected]
+    columns += [c for c in (Resume.upload_time, Resume.resume_id) if c not in columns]
+    query = db.query(*columns)
+
+    if status:
+        query = query.filter(Resume.status == status)
+    if decision:
+        query = query.filter(Resume.decision == decision)
+    if jd_hash:
+        query = query.filter(Resume.jd_hash == jd_hash)
+    if min_score is not None:
+        query = query.filter(Resume.final_score >= min_score)
+    if max_score is not None:
+        query = query.filter(Resume.final_score <= max_score)
+
+    if cursor:
+        after_time, after_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Resume.upload_time < after_time,
+            and_(Resume.upload_time == after_time, Resume.resume_id < after_id)
+        ))
+
+    rows = (
+        query.order_by(Resume.upload_time.desc(), Resume.resume_id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    resumes = []
+    for row in rows:
+        item = {name: row._mapping[LISTABLE_FIELDS[name]] for name in selected}
+        if item.get("upload_time"):
+            item["upload_time"] = item["upload_time"].isoformat()
+        resumes.append(item)
+
+    return {
+        "resumes": resumes,
+        "next_cursor": encode_cursor(rows[-1].upload_time, rows[-1].resume_id) if has_more else None
+    }
+
+
+@router.get("/resumes/status")
+def get_bulk_status(
+    request: Request,
+    response: Response,
+    ids: str = None,
+    jd_hash: str = None,
+    since: str = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Status and scores for many resumes in one call (comma-separated ids,
+    or every resume of a jd_hash), without extracted_text.
+
+    Conditional polling: send back the ETag as If-None-Match and an
+    unchanged batch costs a 304. Passing the returned "version" as
+    ?since= limits the body to rows written from STATUS_SINCE_OVERLAP_SECONDS
+    before that version onwards. The overlap catches writes that committed
+    after a later-stamped one, so rows near the cursor come back again;
+    merge by resume_id. A since request is therefore never empty on its
+    own account - the 304 comes from the ETag like any other poll.
+    """
+    resume_ids = [resume_id for resume_id in (ids or "").split(",") if resume_id]
+    if not resume_ids and not jd_hash:
+        raise HTTPException(status_code=400, detail="Pass ids or jd_hash")
+
+    try:
+        since_time = datetime.fromisoformat(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since must be a version returned by this endpoint")
+
+    overlap_start = since_time - timedelta(seconds=STATUS_SINCE_OVERLAP_SECONDS) if since_time else None
+    rows = status_rows(db, resume_ids, jd_hash, overlap_start)
+    version = max((row["updated_at"] for row in rows if row["updated_at"]), default=since)
+
+    etag = 'W/"' + hashlib.sha1(
+        json.dumps([since, rows], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest() + '"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return {
-        "resumes": [
-            {
-                "resume_id": r.resume_id,
-                "candidate_name": r.candidate_name,
-                "jd_hash": r.jd_hash,
-                "status": r.status,
-                "quality_score": r.quality_score,
-                "final_score": r.final_score,
-                "decision": r.decision,
-                "error_message": r.error_message,
-                "skill_data": r.skill_data,
-                "upload_time": r.upload_time.isoformat() if r.upload_time else None
-            }
-            for r in resumes
-        ]
+        "version": version,
+        "count": len(rows),
+        "resumes": rows
     }
 
+
 @router.get("/resumes/status/{resume_id}")
 def get_resume_status(resume_id: str, db: Session = Depends(get_db)):
-    resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
+    resume = (
+        db.query(Resume)
+        .options(undefer(Resume.extracted_text))
+        .filter(Resume.resume_id == resume_id)
+        .first()
+    )
 
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -38,6 +224,7 @@ def get_resume_status(resume_id: str, db: Session = Depends(get_db)):
     return {
     "resume_id": resume.resume_id,
     "candidate_name": resume.candidate_name,
+    "display_id": resume.display_id,
     "jd_hash": resume.jd_hash,
     "status": resume.status,
     "quality_score": resume.quality_score,
@@ -45,4 +232,73 @@ def get_resume_status(resume_id: str, db: Session = Depends(get_db)):
     "decision": resume.decision,
     "error_message": resume.error_message,
     "extracted_text": resume.extracted_text
-}
\ No newline at end of file
+}
+
+
+def status_snapshot(resume_ids: list, jd_hash: str) -> dict:
+    db = SessionLocal()
+    try:
+        # updated_at also moves on writes the dashboard does not show
+        return {
+            row["resume_id"]: {key: value for key, value in row.items() if key != "updated_at"}
+            for row in status_rows(db, resume_ids, jd_hash)
+        }
+    finally:
+        db.close()
+
+
+def sse_event(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+@router.get("/resumes/events")
+async def stream_resume_status(request: Request, ids: str = None, jd_hash: str = None):
+    """
+    Server-sent events for a set of resumes (comma-separated ids, or every
+    resume of a jd_hash). Sends the current state of each resume first,
+    then one "status" event whenever a resume's status or scores change.
+    A final "done" event follows once every resume is finished. Streams are
+    capped at STATUS_STREAM_MAX_SECONDS and then end with an "expired" event,
+    so a resume stuck in PROCESSING cannot hold a connection open forever.
+
+    Workers may run in other processes, so changes are picked up with one
+    narrow query per interval for the whole subscription rather than a
+    request per resume from the client.
+    """
+    resume_ids = [resume_id for resume_id in (ids or "").split(",") if resume_id]
+    if not resume_ids and not jd_hash:
+        raise HTTPException(status_code=400, detail="Pass ids or jd_hash")
+
+    async def events():
+        sent = {}
+        started = last_write = time.monotonic()
+        yield f"retry: {int(STATUS_STREAM_INTERVAL_SECONDS * 3000)}\n\n"
+
+        while not await request.is_disconnected():
+            snapshot = await run_in_threadpool(status_snapshot, resume_ids, jd_hash)
+
+            for resume_id, state in snapshot.items():
+                if sent.get(resume_id) != state:
+                    sent[resume_id] = state
+                    yield sse_event("status", state)
+                    last_write = time.monotonic()
+
+            if (resume_ids or snapshot) and all(state["status"] in FINAL_STATUSES for state in snapshot.values()):
+                yield sse_event("done", {"resumes": len(snapshot)})
+                return
+
+            if time.monotonic() - started >= STATUS_STREAM_MAX_SECONDS:
+                yield sse_event("expired", {"seconds": STATUS_STREAM_MAX_SECONDS})
+                return
+
+            if time.monotonic() - last_write >= STATUS_STREAM_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                last_write = time.monotonic()
+
+            await asyncio.sleep(STATUS_STREAM_INTERVAL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -7,9 +7,18 @@ from sqlalchemy.orm import Session
 from fastapi import Form
 from app.database import get_db
 from app.models.resume import Resume
-from app.workers.resume_worker import process_resume_async
-from concurrent.futures import ThreadPoolExecutor
-executor = ThreadPoolExecutor(max_workers=2)
+from app.workers.job_queue import enqueue_job
+from app.workers.job_runner import job_runner
+from app.core.config import PIPELINE_BATCH_SIZE, MAX_FILE_SIZE
+from app.pipeline.jd_cache import compute_jd_hash
+from app.workers.resume_dedup import (
+    find_processed_duplicate,
+    can_reuse_results,
+    has_stored_features,
+    copy_resume_results,
+)
+from app.utils.name_extractor import generate_resume_id
+from app.utils.upload_stream import save_upload_stream, UploadTooLargeError, EmptyUploadError
 
 
 
@@ -17,7 +26,8 @@ router = APIRouter()
 
 ALLOWED_EXTENSIONS = {".pdf", ".docx"}
 UPLOAD_DIR = "uploads"
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
+# Requests the size limit middleware guards (see main.py)
+UPLOAD_PATHS = ("/api/resumes/upload", "/api/analyze")
 
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
@@ -26,6 +36,11 @@ def is_allowed_file(filename: str) -> bool:
     return any(filename.lower().endswith(ext) for ext in ALLOWED_EXTENSIONS)
 
 
+def too_large_reason(error: UploadTooLargeError) -> str:
+    received = error.args[0] if error.args else 0
+    return f"File too large (max 10MB, got over {received / 1024 / 1024:.2f}MB)"
+
+
 @router.post("/resumes/upload")
 async def upload_resumes(
     background_tasks: BackgroundTasks,
@@ -46,27 +61,19 @@ async def upload_resumes(
             continue
 
         resume_id = f"RES_{uuid.uuid4().hex[:8].upper()}"
-        file_path = os.path.join(UPLOAD_DIR, f"{resume_id}_{file.filename}")
+        file_path = os.path.join(UPLOAD_DIR, f"{resume_id}_{os.path.basename(file.filename)}")
 
-        # ---------- Save file safely ----------
+        # ---------- Copy the spooled upload to disk (size checked per chunk) ----------
         try:
-            content = await file.read()
-            file.file.seek(0)
+            _, content_hash = await save_upload_stream(file, file_path, MAX_FILE_SIZE)
 
-            if not content:
-                raise ValueError("Empty file")
-            
-            # ---------- File size validation ----------
-            if len(content) > MAX_FILE_SIZE:
-                responses.append({
-                    "filename": file.filename,
-                    "status": "REJECTED",
-                    "reason": f"File too large (max 10MB, got {len(content) / 1024 / 1024:.2f}MB)"
-                })
-                continue
-
-            with open(file_path, "wb") as f:
-                f.write(content)
+        except UploadTooLargeError as e:
+            responses.append({
+                "filename": file.filename,
+                "status": "REJECTED",
+                "reason": too_large_reason(e)
+            })
+            continue
 
         except Exception:
             responses.append({
@@ -80,6 +87,7 @@ async def upload_resumes(
         try:
             resume = Resume(
                 resume_id=resume_id,
+                content_hash=content_hash,
                 status="PROCESSING"  # MUST MATCH ENUM EXACTLY
             )
             db.add(resume)
@@ -94,13 +102,13 @@ async def upload_resumes(
             })
             continue
 
-        # ---------- Trigger async pipeline ----------
+        # ---------- Trigger async pipeline (durable job) ----------
         try:
-            executor.submit(
-                process_resume_async,
-                resume_id,
-                file_path
-            )
+            enqueue_job(db, "resume", {
+                "resume_id": resume_id,
+                "file_path": file_path
+            })
+            job_runner.notify()
             
             responses.append({
                 "resume_id": resume_id,
@@ -128,10 +136,11 @@ async def analyze_resumes(
     db: Session = Depends(get_db)
 ):
     results = []
+    queued_jobs = []
+    rescore_jobs = []
     
-    # Generate hash of JD for grouping
-    import hashlib
-    jd_hash = hashlib.md5(jd_text.encode()).hexdigest()[:16]
+    # Generate hash of JD for grouping (also keys the compiled-JD cache)
+    jd_hash = compute_jd_hash(jd_text)
 
     for file in files:
         # Validate file type
@@ -144,18 +153,22 @@ async def analyze_resumes(
             continue
 
         try:
-            content = await file.read()
-            
-            # Validate file size
-            if len(content) > MAX_FILE_SIZE:
+            extension = os.path.splitext(file.filename)[1].lower()
+
+            # Text extraction and name NER run in the worker; the readable
+            # display ID is assigned there once the candidate name is known
+            resume_id = f"RES_{uuid.uuid4().hex[:8].upper()}"
+            file_path = os.path.join(UPLOAD_DIR, f"{resume_id}{extension}")
+            try:
+                _, content_hash = await save_upload_stream(file, file_path, MAX_FILE_SIZE)
+            except UploadTooLargeError as e:
                 results.append({
                     "filename": file.filename,
                     "status": "REJECTED",
-                    "reason": f"File too large (max 10MB, got {len(content) / 1024 / 1024:.2f}MB)"
+                    "reason": too_large_reason(e)
                 })
                 continue
-            
-            if not content:
+            except EmptyUploadError:
                 results.append({
                     "filename": file.filename,
                     "status": "REJECTED",
@@ -163,45 +176,56 @@ async def analyze_resumes(
                 })
                 continue
 
-            # Quick name extraction for ID generation
-            from app.utils.name_extractor import extract_candidate_name, generate_resume_id
-            from app.pipeline.ingestion import extract_text_from_pdf
-            
-            # Save temp file to extract name
-            temp_path = os.path.join(UPLOAD_DIR, f"temp_{uuid.uuid4().hex[:8]}.pdf")
-            with open(temp_path, "wb") as f:
-                f.write(content)
-            
-            try:
-                # Extract text and name
-                text = extract_text_from_pdf(temp_path)
-                candidate_name = extract_candidate_name(text) if text else "Unknown"
-                resume_id = generate_resume_id(candidate_name)
-            except Exception:
-                # Fallback to old format if extraction fails
-                candidate_name = "Unknown"
-                resume_id = f"RES_{uuid.uuid4().hex[:8].upper()}"
-            
-            # Rename to final path
-            file_path = os.path.join(UPLOAD_DIR, f"{resume_id}.pdf")
-            os.rename(temp_path, file_path)
+            # Same bytes seen before? Reuse what we already know about them
+            duplicate = find_processed_duplicate(db, content_hash, jd_hash)
 
             resume = Resume(
                 resume_id=resume_id,
-                candidate_name=candidate_name,
                 jd_hash=jd_hash,
+                content_hash=content_hash,
                 status="PROCESSING"
             )
+            if duplicate and duplicate.candidate_name:
+                # No worker ingestion will run for reused results: name them now
+                resume.candidate_name = duplicate.candidate_name
+                resume.display_id = generate_resume_id(duplicate.candidate_name)
             db.add(resume)
-            db.commit()
 
-            # Background processing
-            executor.submit(process_resume_background, resume_id, file_path, jd_text)
+            if duplicate and can_reuse_results(duplicate, jd_hash):
+                # Same bytes, same JD (or a JD-independent rejection): copy results now
+                copy_resume_results(db, duplicate, resume)
+                resume.file_path = file_path
+                db.commit()
+
+                results.append({
+                    "resume_id": resume_id,
+                    "candidate_name": resume.candidate_name,
+                    "display_id": resume.display_id,
+                    "jd_hash": jd_hash,
+                    "content_hash": content_hash,
+                    "status": resume.status,
+                    "reused_from": duplicate.resume_id
+                })
+                continue
+
+            if duplicate and duplicate.status == "PROCESSED" and has_stored_features(db, duplicate.resume_id):
+                # Same bytes, new JD: only the JD-dependent stages need to run
+                resume.reused_from = duplicate.resume_id
+                resume.dedup_kind = "JD_ONLY"
+                resume.extracted_text = duplicate.extracted_text
+                db.commit()
+                rescore_jobs.append((resume_id, file_path, duplicate.resume_id))
+            else:
+                db.commit()
+                # Queued for batched background processing below
+                queued_jobs.append((resume_id, file_path))
 
             results.append({
                 "resume_id": resume_id,
-                "candidate_name": candidate_name,
+                "candidate_name": resume.candidate_name,
+                "display_id": resume.display_id,
                 "jd_hash": jd_hash,
+                "content_hash": content_hash,
                 "status": "PROCESSING"
             })
         except Exception as e:
@@ -211,35 +235,46 @@ async def analyze_resumes(
                 "reason": str(e)
             })
 
+    # Background processing: one durable job per PIPELINE_BATCH_SIZE resumes
+    for start in range(0, len(queued_jobs), PIPELINE_BATCH_SIZE):
+        batch = queued_jobs[start:start + PIPELINE_BATCH_SIZE]
+        try:
+            enqueue_job(db, "resume_batch", {
+                "jobs": [list(job) for job in batch],
+                "jd_text": jd_text,
+                "jd_hash": jd_hash
+            })
+        except Exception as e:
+            db.rollback()
+            print(f"ERROR queueing batch: {e}")
+            for resume_id, _ in batch:
+                resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
+                if resume:
+                    resume.status = "ERROR"
+                    resume.error_message = "Failed to start processing"
+            db.commit()
+
+    # Re-uploads against a new JD: reuse stored features, rescore only
+    for resume_id, file_path, source_resume_id in rescore_jobs:
+        try:
+            enqueue_job(db, "resume_rescore", {
+                "resume_id": resume_id,
+                "file_path": file_path,
+                "source_resume_id": source_resume_id,
+                "jd_text": jd_text,
+                "jd_hash": jd_hash
+            })
+        except Exception as e:
+            db.rollback()
+            print(f"ERROR queueing rescore: {e}")
+            resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
+            if resume:
+                resume.status = "ERROR"
+                resume.error_message = "Failed to start processing"
+            db.commit()
+    job_runner.notify()
+
     return {
         "message": "Processing started",
         "resumes": results
     }
-
-def process_resume_background(resume_id, file_path, jd_text):
-    from app.database import SessionLocal
-    db = SessionLocal()
-    print(f"Started processing {resume_id}")
-
-    try:
-        from app.pipeline.jd_intelligence import jd_stage
-        jd_data = jd_stage(jd_text)
-
-        process_resume_async(resume_id, file_path, jd_data)
-
-    except Exception as e:
-        print(f"ERROR in background processing {resume_id}: {e}")
-        resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
-        if resume:
-            resume.status = "ERROR"
-            db.commit()
-        
-        # Clean up file on error
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception:
-            pass
-    finally:
-        print(f"Finished processing {resume_id}")
-        db.close()
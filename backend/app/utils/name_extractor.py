@@ -1,7 +1,7 @@
 import re
-from app.core.nlp_manager import NLPManager
 
-nlp = NLPManager.get_spacy()
+# Only PERSON entities are read from the resume's shared parse
+SPACY_PROFILE = "entities"
 
 # Common company names and job-related terms to exclude
 COMPANY_BLACKLIST = {
@@ -46,23 +46,23 @@ def is_likely_company_or_noise(name: str) -> bool:
     
     return False
 
-def extract_candidate_name(text: str) -> str:
+def extract_candidate_name(text: str, analysis) -> str:
     """
     Extract candidate name from resume text.
     Returns the first PERSON entity found, typically the candidate's name.
     Filters out company names and common resume noise.
+
+    Entities come from the resume's AnalyzedDocument (ner runs on the
+    shared Doc if it has not yet); nothing is parsed again here.
     """
     # Take first 800 characters where name is usually located
-    header_text = text[:800]
-    
-    doc = nlp(header_text)
+    header_persons = analysis.entities("PERSON", end_char=800)
     
     # Get all PERSON entities, filter out companies
     person_entities = []
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            if not is_likely_company_or_noise(ent.text):
-                person_entities.append(ent.text)
+    for name in header_persons:
+        if not is_likely_company_or_noise(name):
+            person_entities.append(name)
     
     if person_entities:
         # Return the first valid person name found
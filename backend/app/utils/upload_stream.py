@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+
+class UploadTooLargeError(Exception):
+    pass
+
+
+class EmptyUploadError(Exception):
+    pass
+
+
+def _write_chunk(handle, chunk: bytes):
+    handle.write(chunk)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    ASGI middleware that answers 413 to an upload request larger than
+    max_size before its body is received: at once from Content-Length, or,
+    for a chunked body, as soon as the bytes read so far pass the limit.
+    Runs ahead of Starlette's multipart parser, so an oversized request is
+    never spooled to disk.
+    """
+
+    def __init__(self, app, max_size: int, paths: tuple):
+        self.app = app
+        self.max_size = max_size
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        length = dict(scope["headers"]).get(b"content-length", b"")
+        if length.isdigit() and int(length) > self.max_size:
+            await self._reject(send, int(length))
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_size:
+                    exceeded = True
+                    raise UploadTooLargeError(received)
+            return message
+
+        async def guarded_send(message):
+            nonlocal started
+            if exceeded:
+                # The app turned the aborted body into its own error; answer 413 instead
+                if message["type"] == "http.response.start" and not started:
+                    started = True
+                    await self._reject(send, received)
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadTooLargeError:
+            if started:
+                raise
+            await self._reject(send, received)
+
+    async def _reject(self, send, size: int):
+        body = json.dumps({
+            "detail": f"Upload too large: over {size / 1024 / 1024:.2f}MB, "
+                      f"limit {self.max_size / 1024 / 1024:.0f}MB per request"
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+async def save_upload_stream(file: UploadFile, dest_path: str, max_size: int) -> tuple:
+    """
+    Copy an upload to dest_path in fixed-size chunks.
+
+    By the time the handler runs, Starlette has already received the whole
+    multipart body and spooled each file to a temporary file; only
+    UploadSizeLimitMiddleware (a per-request limit) acts before that. This
+    bounds the per-file copy into uploads/: it stops at max_size, and the
+    SHA-256 is computed on the way, so memory per file stays at one chunk
+    whatever its size. A partial file is removed if the upload is rejected.
+    Returns (size_in_bytes, sha256_hex).
+    """
+    # Skip the copy entirely when the multipart parser recorded the size
+    if getattr(file, "size", None) is not None and file.size > max_size:
+        raise UploadTooLargeError(file.size)
+
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(dest_path, "wb") as handle:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(size)
+
+                digest.update(chunk)
+                await run_in_threadpool(_write_chunk, handle, chunk)
+
+        if size == 0:
+            raise EmptyUploadError()
+
+    except BaseException:
+        try:
+            os.remove(dest_path)
+        except OSError:
+            pass
+        raise
+
+    return size, digest.hexdigest()
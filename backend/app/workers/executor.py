@@ -0,0 +1,132 @@
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.core.config import (
+    EXECUTOR_BACKEND,
+    EXECUTOR_MAX_WORKERS,
+    EXECUTOR_START_METHOD,
+    TORCH_NUM_THREADS,
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _init_process_worker(preloaded: bool, ocr_slots):
+    """Runs once in every worker process before it takes any job."""
+    import torch
+    from app.core.nlp_manager import NLPManager
+    from app.database import engine
+    from app.pipeline.ocr_engine import set_ocr_slots
+
+    # One OCR bound for the parent and every worker
+    set_ocr_slots(ocr_slots)
+
+    # Connections inherited through fork belong to the parent
+    try:
+        engine.dispose(close=False)
+    except TypeError:
+        engine.dispose()
+
+    torch.set_num_threads(TORCH_NUM_THREADS)
+
+    if not preloaded:
+        NLPManager.warm_up()
+
+
+def _create_process_executor() -> ProcessPoolExecutor:
+    from app.core.nlp_manager import NLPManager
+    from app.pipeline.ocr_engine import get_ocr_slots
+
+    start_method = EXECUTOR_START_METHOD
+    if start_method not in multiprocessing.get_all_start_methods():
+        start_method = "spawn"
+
+    context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        # The server process imports the pipeline once; workers fork from it
+        context.set_forkserver_preload(["app.workers.resume_worker"])
+
+    # With fork, load the models once here; workers inherit them copy-on-write
+    preloaded = start_method == "fork"
+    if preloaded:
+        if threading.active_count() > 1:
+            print("[Executor] Warning: forking workers while other threads run; "
+                  "prefer EXECUTOR_START_METHOD=forkserver")
+        NLPManager.warm_up()
+
+    print(f"[Executor] Process pool: {EXECUTOR_MAX_WORKERS} workers, "
+          f"start method {start_method}, {TORCH_NUM_THREADS} torch threads each")
+
+    executor = ProcessPoolExecutor(
+        max_workers=EXECUTOR_MAX_WORKERS,
+        mp_context=context,
+        initializer=_init_process_worker,
+        initargs=(preloaded, get_ocr_slots())
+    )
+    if preloaded:
+        # A fork pool starts all its workers on the first submit; do it now,
+        # from the calling thread, rather than later from the job runner
+        executor.submit(int).result()
+    return executor
+
+
+def get_executor():
+    """
+    Shared background executor, created on first use.
+
+    EXECUTOR_BACKEND=thread gives a ThreadPoolExecutor (the original
+    behaviour); EXECUTOR_BACKEND=process gives a ProcessPoolExecutor so
+    spaCy and torch work is not serialised on the API process's GIL.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                if EXECUTOR_BACKEND == "process":
+                    _executor = _create_process_executor()
+                else:
+                    _executor = ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS)
+    return _executor
+
+
+def start_executor():
+    """
+    Create the pool at startup, before the job runner, warm-up and
+    embedding threads exist, so fork never copies a lock another thread
+    holds.
+    """
+    get_executor()
+
+
+def submit(fn, *args):
+    """
+    Submit to the shared executor. A process pool whose worker died
+    (crash, OOM kill) is broken for good, so it is replaced and the
+    submit retried once.
+    """
+    executor = get_executor()
+    try:
+        return executor.submit(fn, *args)
+    except BrokenProcessPool:
+        print("[Executor] Process pool is broken (a worker died); recreating it")
+        _discard_executor(executor)
+        return get_executor().submit(fn, *args)
+
+
+def _discard_executor(executor):
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executor(wait: bool = False):
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
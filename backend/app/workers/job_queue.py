@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+
+from app.core.config import (
+    JOB_LEASE_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_RETRY_MAX_SECONDS,
+)
+from app.database import SessionLocal
+from app.models.job import Job
+
+
+def enqueue_job(db, kind: str, payload: dict, max_attempts: int = JOB_MAX_ATTEMPTS) -> Job:
+    job = Job(
+        kind=kind,
+        payload=payload,
+        status="QUEUED",
+        attempts=0,
+        max_attempts=max_attempts,
+        available_at=datetime.utcnow()
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def claim_job(worker_id: str):
+    """
+    Lease the oldest available job for worker_id.
+
+    Claiming is a conditional UPDATE (status still QUEUED), so two workers
+    racing for the same row cannot both win. No SKIP LOCKED needed, which
+    keeps this working on SQLite as well as MySQL.
+    Returns (job_id, kind, payload) or None.
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        candidates = (
+            db.query(Job.id)
+            .filter(Job.status == "QUEUED", Job.available_at <= now)
+            .order_by(Job.available_at, Job.id)
+            .limit(10)
+            .all()
+        )
+
+        for (job_id,) in candidates:
+            claimed = (
+                db.query(Job)
+                .filter(Job.id == job_id, Job.status == "QUEUED")
+                .update({
+                    Job.status: "LEASED",
+                    Job.lease_owner: worker_id,
+                    Job.lease_expires_at: now + timedelta(seconds=JOB_LEASE_SECONDS),
+                    Job.heartbeat_at: now,
+                    Job.attempts: Job.attempts + 1
+                }, synchronize_session=False)
+            )
+            db.commit()
+
+            if claimed == 1:
+                job = db.query(Job).filter(Job.id == job_id).first()
+                return job.id, job.kind, job.payload
+
+        return None
+    finally:
+        db.close()
+
+
+def heartbeat_jobs(job_ids: list, worker_id: str) -> int:
+    """Extend the leases this worker still holds. Returns rows renewed."""
+    if not job_ids:
+        return 0
+
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        renewed = (
+            db.query(Job)
+            .filter(Job.id.in_(job_ids), Job.status == "LEASED", Job.lease_owner == worker_id)
+            .update({
+                Job.lease_expires_at: now + timedelta(seconds=JOB_LEASE_SECONDS),
+                Job.heartbeat_at: now
+            }, synchronize_session=False)
+        )
+        db.commit()
+        return renewed
+    finally:
+        db.close()
+
+
+def complete_job(job_id: int, worker_id: str):
+    db = SessionLocal()
+    try:
+        (
+            db.query(Job)
+            .filter(Job.id == job_id, Job.lease_owner == worker_id)
+            .update({
+                Job.status: "DONE",
+                Job.lease_owner: None,
+                Job.lease_expires_at: None,
+                Job.finished_at: datetime.utcnow()
+            }, synchronize_session=False)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def retry_delay_seconds(attempts: int) -> int:
+    # Exponential backoff: base, 2*base, 4*base, ... capped
+    return min(JOB_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), JOB_RETRY_MAX_SECONDS)
+
+
+def fail_job(job_id: int, worker_id: str, error: str) -> bool:
+    """
+    Record a failed attempt. The job is re-queued with backoff while it has
+    attempts left. Returns True when it has failed for good.
+    """
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == job_id, Job.lease_owner == worker_id).first()
+        if not job:
+            # Lease was lost (expired and recovered elsewhere)
+            return False
+
+        job.last_error = (error or "")[:5000]
+        job.lease_owner = None
+        job.lease_expires_at = None
+
+        if job.attempts >= job.max_attempts:
+            job.status = "FAILED"
+            job.finished_at = datetime.utcnow()
+            final = True
+        else:
+            job.status = "QUEUED"
+            job.available_at = datetime.utcnow() + timedelta(seconds=retry_delay_seconds(job.attempts))
+            final = False
+
+        db.commit()
+        return final
+    finally:
+        db.close()
+
+
+def recover_expired_leases() -> list:
+    """
+    Return jobs whose lease ran out (crashed or restarted worker) to the
+    queue, or fail them if they are out of attempts.
+    Returns [(job_id, kind, payload)] of jobs that failed for good.
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        expired = (
+            db.query(Job)
+            .filter(Job.status == "LEASED", Job.lease_expires_at < now)
+            .all()
+        )
+
+        exhausted = []
+        for job in expired:
+            job.lease_owner = None
+            job.lease_expires_at = None
+            job.last_error = "Lease expired before the job finished"
+            if job.attempts >= job.max_attempts:
+                job.status = "FAILED"
+                job.finished_at = now
+                exhausted.append((job.id, job.kind, job.payload))
+            else:
+                job.status = "QUEUED"
+                job.available_at = now
+
+        db.commit()
+
+        if expired:
+            print(f"[Jobs] Recovered {len(expired) - len(exhausted)} expired leases, {len(exhausted)} jobs failed")
+
+        return exhausted
+    finally:
+        db.close()
+
+
+def queue_stats() -> dict:
+    db = SessionLocal()
+    try:
+        counts = dict(
+            db.query(Job.status, func.count(Job.id))
+            .group_by(Job.status)
+            .all()
+        )
+        oldest_queued = (
+            db.query(func.min(Job.created_at))
+            .filter(Job.status == "QUEUED")
+            .scalar()
+        )
+
+        return {
+            "queued": counts.get("QUEUED", 0),
+            "leased": counts.get("LEASED", 0),
+            "done": counts.get("DONE", 0),
+            "failed": counts.get("FAILED", 0),
+            "oldest_queued_seconds": round((datetime.utcnow() - oldest_queued).total_seconds(), 1) if oldest_queued else None
+        }
+    finally:
+        db.close()
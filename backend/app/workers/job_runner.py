@@ -0,0 +1,151 @@
+import os
+import socket
+import threading
+import time
+import uuid
+
+from app.core.config import (
+    EXECUTOR_MAX_WORKERS,
+    JOB_HEARTBEAT_SECONDS,
+    JOB_POLL_INTERVAL_SECONDS,
+)
+from app.workers.executor import start_executor, submit
+from app.workers.job_queue import (
+    claim_job,
+    complete_job,
+    fail_job,
+    heartbeat_jobs,
+    recover_expired_leases,
+)
+from app.workers.resume_worker import run_job, fail_job_resumes
+
+
+class JobRunner:
+    """
+    Pulls jobs from the jobs table and runs them on the shared executor.
+
+    Keeps at most `concurrency` jobs leased at a time, renews their leases
+    while they run, and periodically hands expired leases (from crashed or
+    restarted processes) back to the queue.
+    """
+
+    def __init__(self, concurrency: int = EXECUTOR_MAX_WORKERS):
+        self.concurrency = concurrency
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -------- Lifecycle --------
+    def start(self):
+        if self._thread is not None:
+            return
+        self._recover()
+        self._thread = threading.Thread(target=self._loop, name="job-runner", daemon=True)
+        self._thread.start()
+        print(f"[Jobs] Runner {self.worker_id} started (concurrency {self.concurrency})")
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def notify(self):
+        """Skip the poll interval: new work was just enqueued."""
+        self._wake.set()
+
+    # -------- Internals --------
+    def _recover(self):
+        try:
+            for _, kind, payload in recover_expired_leases():
+                fail_job_resumes(kind, payload, "Job exceeded its retry limit")
+        except Exception as e:
+            print(f"[Jobs] Lease recovery failed: {e}")
+
+    def _on_done(self, job_id: int, kind: str, payload: dict, future):
+        with self._in_flight_lock:
+            self._in_flight.pop(job_id, None)
+
+        try:
+            error = future.exception()
+            if error is None:
+                complete_job(job_id, self.worker_id)
+            else:
+                print(f"[Jobs] Job {job_id} failed: {error}")
+                if fail_job(job_id, self.worker_id, str(error)):
+                    fail_job_resumes(kind, payload, str(error))
+        except Exception as e:
+            # The lease will expire and the job will be recovered
+            print(f"[Jobs] Could not record result of job {job_id}: {e}")
+
+        self._wake.set()
+
+    def _on_submit_failed(self, job_id: int, kind: str, payload: dict, error: Exception):
+        # Never reached the executor: give the lease back now (with backoff)
+        # instead of leaving it LEASED and unheartbeated until it expires
+        print(f"[Jobs] Could not submit job {job_id}: {error}")
+        try:
+            if fail_job(job_id, self.worker_id, f"Submit failed: {error}"):
+                fail_job_resumes(kind, payload, str(error))
+        except Exception as e:
+            print(f"[Jobs] Could not release job {job_id}: {e}")
+
+    def _loop(self):
+        last_heartbeat = time.monotonic()
+
+        while not self._stop.is_set():
+            try:
+                claimed = None
+                with self._in_flight_lock:
+                    has_capacity = len(self._in_flight) < self.concurrency
+
+                if has_capacity:
+                    claimed = claim_job(self.worker_id)
+
+                if claimed:
+                    job_id, kind, payload = claimed
+                    try:
+                        future = submit(run_job, kind, payload)
+                    except Exception as e:
+                        self._on_submit_failed(job_id, kind, payload, e)
+                    else:
+                        with self._in_flight_lock:
+                            self._in_flight[job_id] = future
+                        future.add_done_callback(
+                            lambda f, job_id=job_id, kind=kind, payload=payload: self._on_done(job_id, kind, payload, f)
+                        )
+                        continue
+
+                if time.monotonic() - last_heartbeat >= JOB_HEARTBEAT_SECONDS:
+                    with self._in_flight_lock:
+                        job_ids = list(self._in_flight)
+                    heartbeat_jobs(job_ids, self.worker_id)
+                    self._recover()
+                    last_heartbeat = time.monotonic()
+
+            except Exception as e:
+                print(f"[Jobs] Runner error: {e}")
+
+            self._wake.wait(JOB_POLL_INTERVAL_SECONDS)
+            self._wake.clear()
+
+
+job_runner = JobRunner()
+
+
+if __name__ == "__main__":
+    # Standalone worker: python -m app.workers.job_runner
+    from app.core.nlp_manager import NLPManager
+    from app.database import init_db
+
+    init_db()
+    # Pay the model load before the first job, not inside it
+    NLPManager.warm_up()
+    start_executor()
+    job_runner.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        job_runner.stop()
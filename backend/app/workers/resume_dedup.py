@@ -0,0 +1,90 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.resume import Resume
+from app.models.resume_features import ResumeFeatures
+from app.pipeline.feature_store import current_backend_features
+from app.pipeline.score_store import copy_result_scores, has_current_versions
+
+# Outcomes whose stored results can be reused for identical bytes
+REUSABLE_STATUSES = ("PROCESSED", "INVALID_RESUME")
+
+
+def find_processed_duplicate(db: Session, content_hash: str, jd_hash: str):
+    """
+    Most relevant earlier resume with the same bytes: one already scored
+    against the same JD with the current JD compiler and embedding backend
+    if there is one, otherwise the latest finished one.
+    """
+    if not content_hash:
+        return None
+
+    candidates = (
+        db.query(Resume)
+        .filter(
+            Resume.content_hash == content_hash,
+            Resume.status.in_(REUSABLE_STATUSES)
+        )
+        .order_by(Resume.upload_time.desc())
+        .limit(20)
+        .all()
+    )
+
+    for candidate in candidates:
+        if candidate.jd_hash == jd_hash and has_current_versions(candidate):
+            return candidate
+
+    return candidates[0] if candidates else None
+
+
+def can_reuse_results(source: Resume, jd_hash: str) -> bool:
+    # A result from an older JD compiler or another embedding backend is
+    # re-scored instead (JD_ONLY if its features are still usable)
+    if not has_current_versions(source):
+        return False
+    # Quality gate rejections do not depend on the JD
+    return source.jd_hash == jd_hash or source.status == "INVALID_RESUME"
+
+
+def has_stored_features(db: Session, resume_id: str) -> bool:
+    return db.query(ResumeFeatures.resume_id).filter(
+        ResumeFeatures.resume_id == resume_id,
+        current_backend_features()
+    ).first() is not None
+
+
+def copy_resume_results(db: Session, source: Resume, target: Resume):
+    """Give target the stored outcome of source (same bytes, same JD)."""
+    target.status = source.status
+    target.quality_score = source.quality_score
+    target.final_score = source.final_score
+    target.decision = source.decision
+    target.error_message = source.error_message
+    target.extracted_text = source.extracted_text
+    target.skill_data = source.skill_data
+    target.jd_compiler_version = source.jd_compiler_version
+    target.embedding_model = source.embedding_model
+    target.reused_from = source.resume_id
+    target.dedup_kind = "REUSED"
+    copy_result_scores(db, source, target)
+
+
+def dedup_stats(db: Session) -> dict:
+    """How many hashed uploads skipped the full pipeline."""
+    counts = dict(
+        db.query(Resume.dedup_kind, func.count(Resume.resume_id))
+        .filter(Resume.content_hash.isnot(None))
+        .group_by(Resume.dedup_kind)
+        .all()
+    )
+    total = sum(counts.values())
+    reused = counts.get("REUSED", 0)
+    jd_only = counts.get("JD_ONLY", 0)
+
+    return {
+        "uploads": total,
+        "reused": reused,
+        "jd_only": jd_only,
+        "full_pipeline": total - reused - jd_only,
+        "hit_rate": round((reused + jd_only) / total, 4) if total else 0.0
+    }
@@ -5,24 +5,219 @@ import os
 from app.models.resume import Resume
 
 # Pipeline engines (we will implement these one by one)
-from app.pipeline.ingestion import ingestion_stage
+from app.pipeline.ingestion import ingestion_stage, ingestion_batch_stage, IngestionError
 from app.pipeline.document_intelligence import document_intelligence_stage
 from app.pipeline.segmentation import segmentation_stage
+from app.pipeline.sentence_embeddings import sentence_embedding_stage, sentence_embedding_batch_stage
 from app.pipeline.grammar_engine import grammar_stage
 from app.pipeline.semantic_role_engine import semantic_role_stage
 from app.pipeline.discourse_engine import discourse_stage
 from app.pipeline.section_behavior_engine import section_behavior_stage
 from app.pipeline.consistency_engine import consistency_stage
-from app.pipeline.quality_gate import quality_gate_stage
+from app.pipeline.quality_gate import quality_gate_stage, quality_gate_fails_early, QualityGateError
 from app.pipeline.ner_engine import ner_stage
 from app.pipeline.skill_intelligence import skill_intelligence_stage
-from app.pipeline.jd_intelligence import jd_stage
+from app.pipeline.jd_cache import get_compiled_jd
 from app.pipeline.matching_engine import matching_stage
 from app.pipeline.explanation_engine import explanation_stage
+from app.pipeline.feature_store import save_resume_features, load_resume_features, current_backend_features
+from app.pipeline.score_store import store_result_scores, stamp_result_versions
+from app.models.resume_features import ResumeFeatures
+from app.utils.name_extractor import extract_candidate_name, generate_resume_id, SPACY_PROFILE as NAME_SPACY_PROFILE
+
+# Failures a retry cannot fix: unreadable files, failed quality checks, bad
+# input. Anything else (DB disconnects, model or memory errors, timeouts)
+# goes back to the job queue, which retries with backoff and only marks the
+# resume ERROR after the last attempt (fail_job_resumes)
+PERMANENT_ERRORS = (IngestionError, QualityGateError, ValueError)
+
+
+class RetryableResumeError(Exception):
+    """Some resumes of a batch hit a temporary failure and stay PROCESSING for the retry."""
+    pass
+
+
+def assign_candidate_identity(resume: Resume, data: dict):
+    """Candidate name and readable FirstLast_XXXX ID, from the shared parse."""
+    if not resume.candidate_name or resume.candidate_name == "Unknown":
+        # ner runs once on the shared Doc; ner_stage reuses it later
+        data["analysis"].ensure(NAME_SPACY_PROFILE)
+        resume.candidate_name = extract_candidate_name(data["raw_text"], data["analysis"])
+    if not resume.display_id:
+        resume.display_id = generate_resume_id(resume.candidate_name)
+
+
+def store_extracted_text(db: Session, resume: Resume, data: dict):
+    # Store extracted text for preview
+    resume.extracted_text = data.get("raw_text", "")[:5000]  # Store first 5000 chars
+    assign_candidate_identity(resume, data)
+    db.commit()
+
+
+def run_structure_stages(data: dict) -> dict:
+    print("Stage 2 - document_intelligence")
+    data = document_intelligence_stage(data)
+
+    print("Stage 3 - segmentation")
+    data = segmentation_stage(data)
+
+    return data
+
+
+def run_cheap_quality_stages(data: dict) -> dict:
+    """Quality signals read straight off the shared parse (no embeddings)."""
+    print("Stage 4 - grammar")
+    data = grammar_stage(data)
+
+    print("Stage 5 - semantic_role")
+    data = semantic_role_stage(data)
+
+    print("Stage 7 - section_behavior")
+    data = section_behavior_stage(data)
+
+    print("Stage 8 - consistency")
+    data = consistency_stage(data)
+
+    return data
+
+
+def needs_full_embeddings(resume_id: str, data: dict) -> bool:
+    """
+    A resume the gate is already certain to reject only needs discourse,
+    which embeds its few non-fragment sentences on its own.
+    """
+    if quality_gate_fails_early(data):
+        print(f"Quality gate already failing for {resume_id}, skipping full sentence embeddings")
+        return False
+    return True
+
+
+def run_discourse_stage(data: dict) -> dict:
+    print("Stage 6 - discourse")
+    return discourse_stage(data)
+
+
+def apply_quality_gate(db: Session, resume: Resume, data: dict) -> bool:
+    print("Stage 9 - quality gate")
+    is_valid, quality_score = quality_gate_stage(data)
+    resume.quality_score = quality_score
+    db.commit()
+
+    if is_valid:
+        return True
+
+    print(f"Resume failed quality gate with score {quality_score}")
+    resume.status = "INVALID_RESUME"
+    resume.decision = "REJECTED"
+    stamp_result_versions(resume)
+
+    # Add specific quality gate failure reason
+    reasons = []
+    if data.get("grammar_score", 0) < 0.20:
+        reasons.append("Poor grammar quality")
+    if data.get("semantic_role_score", 0) < 0.50:
+        reasons.append("Weak sentence structure")
+    if data.get("fragment_ratio", 0) > 0.60:
+        reasons.append("Too many incomplete sentences")
+    if quality_score < 0.45:
+        reasons.append("Overall quality below threshold")
+
+    resume.error_message = "Quality gate failed: " + ", ".join(reasons) if reasons else "Resume quality below minimum standards"
+    db.commit()
+    return False
+
+
+def run_scoring_stages(db: Session, resume: Resume, resume_id: str, file_path: str, data: dict, jd_data: dict):
+    print("Stage 10 - ner")
+    data = ner_stage(data)
+
+    # Keep the JD-independent features so the resume can be re-ranked later
+    try:
+        save_resume_features(db, resume_id, data, resume.quality_score)
+    except Exception as e:
+        db.rollback()
+        print(f"[Features] Could not store features for {resume_id}: {e}")
+
+    score_and_save(db, resume, resume_id, file_path, data, jd_data)
+
+
+def score_and_save(db: Session, resume: Resume, resume_id: str, file_path: str, data: dict, jd_data: dict):
+    """JD-dependent stages 11-12 and the result writes."""
+    print("Stage 11 - skill_intelligence")
+    data["jd_data"] = jd_data
+    data = skill_intelligence_stage(data)
+
+    print("Stage 12 - matching")
+    final_score, final_score_data = matching_stage(data, jd_data)
+
+    # Store skill matching data
+    matched_skills = []
+    missing_skills = []
+
+    if jd_data.get("mandatory_skills"):
+        skill_confidence = data.get("skill_confidence", {})
+        for skill in jd_data["mandatory_skills"]:
+            if skill_confidence.get(skill, 0) > 0.3:
+                matched_skills.append(skill)
+            else:
+                missing_skills.append(skill)
+
+    resume.skill_data = {
+        "matched": matched_skills,
+        "missing": missing_skills,
+        "all_jd_skills": jd_data.get("mandatory_skills", []) + jd_data.get("optional_skills", [])[:5]
+    }
+
+    resume.status = "PROCESSED"
+    resume.final_score = final_score
+    resume.decision = final_score_data["decision"]
+    resume.file_path = file_path  # Store file path for later viewing
+    # Engine scores and reasons ride along in the same UPDATE
+    store_result_scores(resume, final_score_data)
+    stamp_result_versions(resume)
+    db.commit()
+
+
+def mark_resume_error(db: Session, resume_id: str, e: Exception):
+    print(f"ERROR in {resume_id}: {e}")
+    import traceback
+    traceback.print_exception(type(e), e, e.__traceback__)
+
+    db.rollback()
+    resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
+    if resume:
+        resume.status = "ERROR"
+        # Store user-friendly error message
+        error_msg = str(e)
+        if "IngestionError" in str(type(e)):
+            resume.error_message = f"File processing failed: {error_msg}"
+        elif "QualityGateError" in str(type(e)):
+            resume.error_message = f"Quality check failed: {error_msg}"
+        elif "spaCy" in error_msg or "NLP" in error_msg:
+            resume.error_message = "Text analysis failed. Please ensure the resume contains readable text."
+        else:
+            resume.error_message = f"Processing error: {error_msg}"
+        db.commit()
+
+
+def defer_resume_error(db: Session, resume_id: str, e: Exception, retry: list):
+    """Batch counterpart of the single-resume except clauses."""
+    if isinstance(e, PERMANENT_ERRORS):
+        mark_resume_error(db, resume_id, e)
+        return
+
+    print(f"Temporary failure in {resume_id}, leaving it for a retry: {e}")
+    db.rollback()
+    retry.append(resume_id)
+
+
+def raise_for_retry(retry: list, error: Exception):
+    if retry:
+        raise RetryableResumeError(f"{len(retry)} resume(s) failed temporarily ({error}): {', '.join(retry)}")
 
 
 def process_resume_async(resume_id: str, file_path: str, jd_data: dict = None):
-    
+
     db: Session = SessionLocal()
     if jd_data is None:
         jd_data = {}
@@ -34,142 +229,237 @@ def process_resume_async(resume_id: str, file_path: str, jd_data: dict = None):
 
         print("Stage 1 - ingestion")
         data = ingestion_stage(file_path)
-        
-        # Store extracted text for preview
-        resume.extracted_text = data.get("raw_text", "")[:5000]  # Store first 5000 chars
-        db.commit()
-        
-        print("Stage 2 - document_intelligence")
-        data = document_intelligence_stage(data)
-        
-        print("Stage 3 - segmentation")
-        data = segmentation_stage(data)
-        
-        print("Stage 4 - grammar")
-        data = grammar_stage(data)
-        
-        print("Stage 5 - semantic_role")
-        data = semantic_role_stage(data)
-        
-        print("Stage 6 - discourse")
-        data = discourse_stage(data)
-        
-        print("Stage 7 - section_behavior")
-        data = section_behavior_stage(data)
-        
-        print("Stage 8 - consistency")
-        data = consistency_stage(data)
-
-        print("Stage 9 - quality gate")
-        is_valid, quality_score = quality_gate_stage(data)
-        resume.quality_score = quality_score
-        db.commit()
+        store_extracted_text(db, resume, data)
 
-        if not is_valid:
-            print(f"Resume failed quality gate with score {quality_score}")
-            resume.status = "INVALID_RESUME"
-            resume.decision = "REJECTED"
-            
-            # Add specific quality gate failure reason
-            reasons = []
-            if data.get("grammar_score", 0) < 0.20:
-                reasons.append("Poor grammar quality")
-            if data.get("semantic_role_score", 0) < 0.50:
-                reasons.append("Weak sentence structure")
-            if data.get("fragment_ratio", 0) > 0.60:
-                reasons.append("Too many incomplete sentences")
-            if quality_score < 0.45:
-                reasons.append("Overall quality below threshold")
-            
-            resume.error_message = "Quality gate failed: " + ", ".join(reasons) if reasons else "Resume quality below minimum standards"
-            db.commit()
+        data = run_structure_stages(data)
+        data = run_cheap_quality_stages(data)
+
+        # Every unique sentence is embedded once; discourse and matching slice it
+        if needs_full_embeddings(resume_id, data):
+            print("Stage 3b - sentence embeddings")
+            data = sentence_embedding_stage(data)
+
+        data = run_discourse_stage(data)
+
+        if not apply_quality_gate(db, resume, data):
             return
 
-        print("Stage 10 - ner")
-        data = ner_stage(data)
-        
-        # Store candidate name if not already set
-        if not resume.candidate_name or resume.candidate_name == "Unknown":
-            entities = data.get("entities", {})
-            names = entities.get("names", [])
-            if names:
-                resume.candidate_name = names[0]
-                db.commit()
-        
-        print("Stage 11 - skill_intelligence")
-        data["jd_data"] = jd_data
-        data = skill_intelligence_stage(data)
-        
-        print("Stage 12 - matching")
-        final_score, final_score_data = matching_stage(data, jd_data)
-        
-        # Store skill matching data
-        matched_skills = []
-        missing_skills = []
-        
-        if jd_data.get("mandatory_skills"):
-            skill_confidence = data.get("skill_confidence", {})
-            for skill in jd_data["mandatory_skills"]:
-                if skill_confidence.get(skill, 0) > 0.3:
-                    matched_skills.append(skill)
-                else:
-                    missing_skills.append(skill)
-        
-        resume.skill_data = {
-            "matched": matched_skills,
-            "missing": missing_skills,
-            "all_jd_skills": jd_data.get("mandatory_skills", []) + jd_data.get("optional_skills", [])[:5]
+        run_scoring_stages(db, resume, resume_id, file_path, data, jd_data)
+
+        print(f"Finished {resume_id}")
+
+    except PERMANENT_ERRORS as e:
+        mark_resume_error(db, resume_id, e)
+
+    finally:
+        db.close()
+
+        # Don't delete file anymore - keep it for viewing
+        # Optionally: Clean up files older than X days in a separate cleanup job
+
+
+def process_resume_batch(jobs: list, jd_data: dict = None):
+    """
+    Batch execution mode: runs each stage across a list of
+    (resume_id, file_path) jobs. spaCy parsing goes through one nlp.pipe
+    call and sentence embeddings through one model.encode call; everything
+    written to the DB per resume matches process_resume_async.
+
+    Temporary failures do not stop the rest of the batch; they are raised
+    together at the end as RetryableResumeError so the job is retried for
+    the resumes still PROCESSING.
+    """
+    db: Session = SessionLocal()
+    if jd_data is None:
+        jd_data = {}
+    retry = []
+    last_error = None
+
+    try:
+        print(f"Started batch of {len(jobs)}")
+
+        resume_ids = [resume_id for resume_id, _ in jobs]
+        resumes = {
+            r.resume_id: r
+            for r in db.query(Resume).filter(Resume.resume_id.in_(resume_ids)).all()
         }
-        
-        resume.status = "PROCESSED"
-        resume.final_score = final_score
-        resume.decision = final_score_data["decision"]
-        resume.file_path = file_path  # Store file path for later viewing
-        db.commit()
 
-        # save engine scores
-        import uuid
-        from app.models.engine_score import EngineScore
-        from app.models.explanation import Explanation
-
-        scores_to_save = [
-            EngineScore(id=uuid.uuid4().hex, resume_id=resume_id, engine="Skill Match", score=round(final_score_data.get("skill_score", 0) * 100, 2)),
-            EngineScore(id=uuid.uuid4().hex, resume_id=resume_id, engine="Experience", score=round(final_score_data.get("experience_score", 0) * 100, 2)),
-            EngineScore(id=uuid.uuid4().hex, resume_id=resume_id, engine="Education", score=round(final_score_data.get("education_score", 0) * 100, 2)),
-            EngineScore(id=uuid.uuid4().hex, resume_id=resume_id, engine="Semantic Match", score=round(final_score_data.get("semantic_score", 0) * 100, 2)),
-            EngineScore(id=uuid.uuid4().hex, resume_id=resume_id, engine="Quality Gate", score=round((resume.quality_score or 0) * 100, 2)),
+        print("Stage 1 - ingestion (batch)")
+        ingested = ingestion_batch_stage([file_path for _, file_path in jobs])
+
+        active = []
+        for (resume_id, file_path), result in zip(jobs, ingested):
+            if isinstance(result, Exception):
+                defer_resume_error(db, resume_id, result, retry)
+                last_error = result
+                continue
+            try:
+                store_extracted_text(db, resumes[resume_id], result)
+                data = run_cheap_quality_stages(run_structure_stages(result))
+                active.append((resume_id, file_path, data))
+            except Exception as e:
+                defer_resume_error(db, resume_id, e, retry)
+                last_error = e
+
+        if not active:
+            raise_for_retry(retry, last_error)
+            return
+
+        to_embed = [
+            (resume_id, data) for resume_id, _, data in active
+            if needs_full_embeddings(resume_id, data)
         ]
-        db.add_all(scores_to_save)
 
-        for reason in final_score_data.get("reasons", []):
-            db.add(Explanation(id=uuid.uuid4().hex, resume_id=resume_id, message=reason))
+        if to_embed:
+            print("Stage 3b - sentence embeddings (batch)")
+            try:
+                sentence_embedding_batch_stage([data for _, data in to_embed])
+            except Exception as e:
+                failed = {resume_id for resume_id, _ in to_embed}
+                for resume_id in failed:
+                    defer_resume_error(db, resume_id, e, retry)
+                last_error = e
+                active = [job for job in active if job[0] not in failed]
 
-        db.commit()
+        for resume_id, file_path, data in active:
+            try:
+                resume = resumes[resume_id]
+                data = run_discourse_stage(data)
 
-        print(f"Finished {resume_id}")
+                if not apply_quality_gate(db, resume, data):
+                    continue
+
+                run_scoring_stages(db, resume, resume_id, file_path, data, jd_data)
+                print(f"Finished {resume_id}")
+            except Exception as e:
+                defer_resume_error(db, resume_id, e, retry)
+                last_error = e
+
+        raise_for_retry(retry, last_error)
+
+    finally:
+        db.close()
+
+
+def pending_resume_jobs(jobs: list) -> list:
+    """
+    Drop resumes that already left PROCESSING, so a retried or recovered
+    job never scores the same resume twice.
+    """
+    db: Session = SessionLocal()
+    try:
+        resume_ids = [resume_id for resume_id, _ in jobs]
+        pending = {
+            resume_id
+            for (resume_id,) in db.query(Resume.resume_id).filter(
+                Resume.resume_id.in_(resume_ids),
+                Resume.status == "PROCESSING"
+            )
+        }
+        return [(resume_id, file_path) for resume_id, file_path in jobs if resume_id in pending]
+    finally:
+        db.close()
 
-    except Exception as e:
-        print(f"ERROR in {resume_id}: {e}")
-        import traceback
-        traceback.print_exc()
 
+def run_resume_batch_job(payload: dict):
+    jobs = pending_resume_jobs([tuple(job) for job in payload["jobs"]])
+    print(f"Started processing batch of {len(jobs)}")
+    if not jobs:
+        return
+
+    jd_data = get_compiled_jd(payload["jd_text"], payload.get("jd_hash"))
+    process_resume_batch(jobs, jd_data)
+    print(f"Finished processing batch of {len(jobs)}")
+
+
+def run_resume_job(payload: dict):
+    jobs = pending_resume_jobs([(payload["resume_id"], payload["file_path"])])
+    if not jobs:
+        return
+
+    jd_data = get_compiled_jd(payload["jd_text"]) if payload.get("jd_text") else None
+    process_resume_async(payload["resume_id"], payload["file_path"], jd_data)
+
+
+def run_resume_rescore_job(payload: dict):
+    """
+    Duplicate upload scored against a new JD: reuse the source resume's
+    stored JD-independent features and run only stages 11-12.
+    """
+    resume_id = payload["resume_id"]
+    file_path = payload["file_path"]
+    if not pending_resume_jobs([(resume_id, file_path)]):
+        return
+
+    jd_data = get_compiled_jd(payload["jd_text"], payload.get("jd_hash"))
+
+    db: Session = SessionLocal()
+    try:
+        features = db.query(ResumeFeatures).filter(
+            ResumeFeatures.resume_id == payload["source_resume_id"],
+            current_backend_features()
+        ).first()
         resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
-        if resume:
-            resume.status = "ERROR"
-            # Store user-friendly error message
-            error_msg = str(e)
-            if "IngestionError" in str(type(e)):
-                resume.error_message = f"File processing failed: {error_msg}"
-            elif "QualityGateError" in str(type(e)):
-                resume.error_message = f"Quality check failed: {error_msg}"
-            elif "spaCy" in error_msg or "NLP" in error_msg:
-                resume.error_message = "Text analysis failed. Please ensure the resume contains readable text."
-            else:
-                resume.error_message = f"Processing error: {error_msg}"
+
+        if features is None:
+            # Source features are gone (or from another embedding backend);
+            # fall back to the full pipeline
+            resume.dedup_kind = None
+            resume.reused_from = None
             db.commit()
+            process_resume_async(resume_id, file_path, jd_data)
+            return
+
+        print(f"Re-scoring {resume_id} from stored features of {payload['source_resume_id']}")
+        data = load_resume_features(features)
+        resume.quality_score = features.quality_score
+        score_and_save(db, resume, resume_id, file_path, data, jd_data)
+        print(f"Finished {resume_id}")
+
+    except PERMANENT_ERRORS as e:
+        mark_resume_error(db, resume_id, e)
 
     finally:
         db.close()
-        
-        # Don't delete file anymore - keep it for viewing
-        # Optionally: Clean up files older than X days in a separate cleanup job
+
+
+JOB_HANDLERS = {
+    "resume": run_resume_job,
+    "resume_batch": run_resume_batch_job,
+    "resume_rescore": run_resume_rescore_job,
+}
+
+
+def job_resume_files(kind: str, payload: dict) -> list:
+    if kind == "resume_batch":
+        return [tuple(job) for job in payload["jobs"]]
+    return [(payload["resume_id"], payload["file_path"])]
+
+
+def run_job(kind: str, payload: dict):
+    """Entry point for the job runner; raises so the queue can retry."""
+    handler = JOB_HANDLERS.get(kind)
+    if handler is None:
+        raise ValueError(f"Unknown job kind: {kind}")
+    handler(payload)
+
+
+def fail_job_resumes(kind: str, payload: dict, error: str):
+    """Called once a job has used up its retries."""
+    db: Session = SessionLocal()
+    try:
+        for resume_id, file_path in job_resume_files(kind, payload):
+            resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
+            if resume and resume.status == "PROCESSING":
+                resume.status = "ERROR"
+                resume.error_message = f"Processing error: {error}"[:5000]
+                db.commit()
+
+                # Clean up file on error
+                try:
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                except Exception:
+                    pass
+    finally:
+        db.close()
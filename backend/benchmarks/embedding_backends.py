@@ -0,0 +1,109 @@
+"""
+Parity and throughput of the sentence embedding backends (torch fp32,
+torch-int8, onnx) on the sample resumes in frontend/tests (or --files).
+
+fp32 torch is the reference. For each other backend it reports:
+- cosine drift per sentence (1 - cos against the reference vector)
+- ranking agreement against a JD: Spearman correlation over all
+  sentences, and over resumes by semantic score (top-3 sentence mean)
+- sentences/sec
+
+Backends whose dependencies are missing are reported and skipped.
+
+    cd backend
+    python -m benchmarks.embedding_backends --repeat 3
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.core.nlp_manager import NLPManager, EMBEDDING_BACKENDS
+from app.pipeline.corpus_index import CorpusEmbeddingIndex
+from app.pipeline.sentence_embeddings import normalize_rows
+from benchmarks.spacy_profiles import DEFAULT_SAMPLES, load_texts
+
+DEFAULT_JD = (
+    "We are hiring a Python developer to build NLP services with FastAPI. "
+    "Experience with machine learning, spaCy, SQL databases and REST APIs is required."
+)
+
+
+def split_sentences(texts: list) -> list:
+    """[(resume_index, sentence)] for every non-empty sentence."""
+    sentences = []
+    for index, text in enumerate(texts):
+        for sent in NLPManager.parse(text, "sentences").sents:
+            if sent.text.strip():
+                sentences.append((index, sent.text.strip()))
+    return sentences
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    if len(a) < 2:
+        return 1.0
+    rank_a = np.argsort(np.argsort(a)).astype(np.float64)
+    rank_b = np.argsort(np.argsort(b)).astype(np.float64)
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+def encode(model, texts: list, batch_size: int) -> np.ndarray:
+    return normalize_rows(np.asarray(model.encode(texts, batch_size=batch_size), dtype=np.float32))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", default=DEFAULT_SAMPLES)
+    parser.add_argument("--jd", default=DEFAULT_JD, help="JD text to rank against")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = load_texts(args.files)
+    if not texts:
+        raise SystemExit(f"No readable samples matched {args.files}")
+
+    pairs = split_sentences(texts)
+    sentences = [sentence for _, sentence in pairs]
+    owners = np.array([index for index, _ in pairs])
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(owners, minlength=len(texts)))]).astype(np.int64)
+
+    print(f"Resumes: {len(texts)}  sentences: {len(sentences)}  batch size: {args.batch_size}")
+    print(f"{'backend':<12} {'sent/s':>9} {'mean drift':>11} {'max drift':>10} {'sent rho':>9} {'resume rho':>11}")
+
+    reference = None
+    for backend in EMBEDDING_BACKENDS:
+        try:
+            model = NLPManager.load_sentence_transformer(backend)
+        except Exception as e:
+            print(f"{backend:<12} skipped: {e}")
+            continue
+
+        # Warm run, then timed runs
+        vectors = encode(model, sentences, args.batch_size)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            encode(model, sentences, args.batch_size)
+        rate = len(sentences) * args.repeat / (time.perf_counter() - start)
+
+        jd_vector = encode(model, [args.jd], args.batch_size)[0]
+        sentence_scores = vectors @ jd_vector
+        index = CorpusEmbeddingIndex(list(range(len(texts))), vectors, offsets)
+        resume_scores = index.semantic_scores(jd_vector)
+
+        if reference is None:
+            reference = (vectors, sentence_scores, resume_scores)
+            print(f"{backend:<12} {rate:9.1f} {'(reference)':>11}")
+            continue
+
+        ref_vectors, ref_sentence_scores, ref_resume_scores = reference
+        drift = 1 - np.einsum("ij,ij->i", vectors, ref_vectors)
+        print(
+            f"{backend:<12} {rate:9.1f} {drift.mean():11.2e} {drift.max():10.2e} "
+            f"{spearman(sentence_scores, ref_sentence_scores):9.4f} "
+            f"{spearman(resume_scores, ref_resume_scores):11.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
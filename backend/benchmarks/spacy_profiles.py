@@ -0,0 +1,104 @@
+"""
+Parse time per spaCy pipeline profile vs the full en_core_web_sm pipeline.
+
+Each consumer of a parse declares a SPACY_PROFILE. This reports how long
+its parse would take with only those components against the full
+pipeline. The resume parse runs the union of the structure and quality
+stage profiles, without ner; ner then runs on the same Doc when the
+candidate name lookup or stage 10 first needs it. The JD skill parse
+runs its own profile.
+
+Uses the sample resumes in frontend/tests (or --files).
+
+    cd backend
+    python -m benchmarks.spacy_profiles --repeat 5
+"""
+import argparse
+import glob
+import os
+import time
+
+from app.core.nlp_manager import NLPManager, SPACY_PROFILES
+from app.pipeline import (
+    segmentation,
+    grammar_engine,
+    semantic_role_engine,
+    section_behavior_engine,
+    skill_intelligence,
+    ner_engine,
+    jd_intelligence,
+)
+from app.pipeline.ingestion import RESUME_PARSE_PROFILES, extract_resume_text, IngestionError
+
+DEFAULT_SAMPLES = os.path.join("..", "frontend", "tests", "*")
+
+# (consumer, profiles, how much of the text it parses)
+CONSUMERS = [
+    ("segmentation", (segmentation.SPACY_PROFILE,), None),
+    ("grammar", (grammar_engine.SPACY_PROFILE,), None),
+    ("semantic_role", (semantic_role_engine.SPACY_PROFILE,), None),
+    ("section_behavior", (section_behavior_engine.SPACY_PROFILE,), None),
+    ("skill_verbs", (skill_intelligence.SPACY_PROFILE,), None),
+    ("ner", (ner_engine.SPACY_PROFILE,), None),
+    ("resume parse (no ner)", RESUME_PARSE_PROFILES, None),
+    ("jd skills", (jd_intelligence.SPACY_PROFILE,), None),
+]
+
+
+def load_texts(pattern: str) -> list:
+    texts = []
+    for path in sorted(glob.glob(pattern)):
+        try:
+            if path.endswith(".txt"):
+                with open(path, encoding="utf-8", errors="ignore") as handle:
+                    text = handle.read().strip()
+            else:
+                text = extract_resume_text(path)
+        except (IngestionError, OSError):
+            continue
+        if text:
+            texts.append(text)
+    return texts
+
+
+def time_parse(texts: list, disable: list, repeat: int) -> float:
+    nlp = NLPManager.get_spacy()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            nlp(text, disable=disable)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", default=DEFAULT_SAMPLES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = load_texts(args.files)
+    if not texts:
+        raise SystemExit(f"No readable samples matched {args.files}")
+
+    nlp = NLPManager.get_spacy()
+    # Warm the pipeline so the first timed call does not pay allocation costs
+    for text in texts:
+        nlp(text)
+
+    print(f"Samples: {len(texts)}  repeat: {args.repeat}  pipeline: {', '.join(nlp.pipe_names)}")
+    print(f"{'consumer':<22} {'profile':<24} {'full ms':>9} {'profile ms':>11} {'saved':>7}")
+
+    for consumer, profiles, prefix in CONSUMERS:
+        sample = [text[:prefix] for text in texts] if prefix else texts
+        full = time_parse(sample, [], args.repeat)
+        profiled = time_parse(sample, NLPManager.disabled_components(*profiles), args.repeat)
+        saved = 1 - profiled / full if full else 0.0
+        print(f"{consumer:<22} {'+'.join(profiles):<24} {full * 1000:9.2f} {profiled * 1000:11.2f} {saved:7.1%}")
+
+    print()
+    for name, components in SPACY_PROFILES.items():
+        print(f"  {name:<10} {', '.join(components) if components else 'all components'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,12 @@ const LIGHT_COLORS = {
 };
 
 const FINAL_STATUSES = ["PROCESSED", "FAILED", "INVALID_RESUME", "ERROR"];
+const RESUME_PAGE_SIZE = 100;
+// Above this many resumes of one JD, subscribe by jd_hash instead of ids
+const STREAM_MAX_IDS = 50;
+const STREAM_MAX_LIFETIME_MS = 10 * 60 * 1000;
+// Only what the resume list renders; details are fetched per resume
+const RESUME_LIST_FIELDS = "resume_id,display_id,candidate_name,jd_hash,status,quality_score,final_score,decision,error_message,upload_time";
 
 /* ================= SCORE BAR ================= */
 function ScoreBar({ label, score, COLORS }) {
@@ -224,7 +230,7 @@ function ResumeCard({
             marginBottom: 4,
           }}
         >
-          {resume.resume_id}
+          {resume.display_id || resume.resume_id}
         </div>
         <div style={{ fontSize: 12, color: COLORS.textMuted }}>
           {isPending && (
@@ -1516,6 +1522,7 @@ export default function App() {
   const [jd, setJd] = useState("");
   const [files, setFiles] = useState([]);
   const [resumes, setResumes] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [selected, setSelected] = useState(null);
   const [analyzing, setAnalyzing] = useState(false);
   const [uploadProgress, setUploadProgress] = useState(0);
@@ -1530,18 +1537,29 @@ export default function App() {
 
   const COLORS = isDarkMode ? DARK_COLORS : LIGHT_COLORS;
 
-  // Load resumes from database on mount
-  useEffect(() => {
-    const loadResumes = async () => {
-      try {
-        const response = await axios.get("http://localhost:8000/api/resumes");
-        if (response.data.resumes) {
-          setResumes(response.data.resumes);
-        }
-      } catch (error) {
-        console.error("Failed to load resumes:", error);
+  // Load resumes from database one page at a time (newest first)
+  const loadResumes = async (cursor = null) => {
+    try {
+      const response = await axios.get("http://localhost:8000/api/resumes", {
+        params: {
+          limit: RESUME_PAGE_SIZE,
+          fields: RESUME_LIST_FIELDS,
+          ...(cursor ? { cursor } : {}),
+        },
+      });
+      if (response.data.resumes) {
+        const page = response.data.resumes;
+        setResumes((prev) => (cursor ? [...prev, ...page] : page));
+        setNextCursor(response.data.next_cursor);
+        // Resumes still processing from an earlier session
+        subscribeStatus(page.filter((r) => !FINAL_STATUSES.includes(r.status)));
       }
-    };
+    } catch (error) {
+      console.error("Failed to load resumes:", error);
+    }
+  };
+
+  useEffect(() => {
     loadResumes();
   }, []);
 
@@ -1762,7 +1780,9 @@ export default function App() {
 
       const newResumes = res.data.resumes;
       setResumes((prev) => [...prev, ...newResumes]);
-      newResumes.forEach((r) => pollStatus(r.resume_id));
+      subscribeStatus(
+        newResumes.filter((r) => r.resume_id && !FINAL_STATUSES.includes(r.status))
+      );
       
       // Save JD to history
       saveJdToHistory(jd);
@@ -1781,93 +1801,81 @@ export default function App() {
     setUploadProgress(0);
   };
 
-  const pollStatus = (resumeId) => {
-    let retryCount = 0;
-    const maxRetries = 150; // 5 minutes max (150 * 2 seconds)
-    
-    const interval = setInterval(async () => {
-      try {
-        const res = await axios.get(
-          `http://localhost:8000/api/resumes/status/${resumeId}`
-        );
-
-        const data = res.data;
-
-        if (FINAL_STATUSES.includes(data.status)) {
-          clearInterval(interval);
-          setResumes((prev) =>
-            prev.map((r) =>
-              r.resume_id === resumeId ? { ...r, ...data } : r
-            )
-          );
-        }
-        
-        retryCount++;
-        if (retryCount >= maxRetries) {
-          console.warn(`Polling timeout for ${resumeId}`);
-          clearInterval(interval);
-        }
-      } catch (err) {
-        console.error("Polling error:", err);
-        retryCount++;
-        if (retryCount >= 3) {
-          clearInterval(interval);
-        }
+  // Server-sent status events instead of a poll per resume. Large groups
+  // of one JD subscribe by jd_hash (short URL, one connection); the rest go
+  // by id in chunks. Every stream is closed after STREAM_MAX_LIFETIME_MS so
+  // a resume stuck in PROCESSING cannot hold a connection forever.
+  const subscribeStatus = (pending) => {
+    const byJd = {};
+    const loose = [];
+    pending.forEach((r) => {
+      if (r.jd_hash) {
+        (byJd[r.jd_hash] = byJd[r.jd_hash] || []).push(r.resume_id);
+      } else {
+        loose.push(r.resume_id);
       }
-    }, 2000);
-  };
+    });
 
-  const exportToCSV = async () => {
-    try {
-      // Fetch detailed results for all processed resumes
-      const processedResumes = resumes.filter(r => r.status === "PROCESSED");
-      
-      if (processedResumes.length === 0) {
-        alert("No processed resumes to export");
-        return;
+    Object.entries(byJd).forEach(([jdHash, ids]) => {
+      if (ids.length > STREAM_MAX_IDS) {
+        openStatusStream(`jd_hash=${encodeURIComponent(jdHash)}`);
+      } else {
+        loose.push(...ids);
       }
+    });
 
-      const detailedData = await Promise.all(
-        processedResumes.map(async (resume) => {
-          try {
-            const res = await axios.get(
-              `http://localhost:8000/api/resumes/results/${resume.resume_id}`
-            );
-            return { ...resume, details: res.data };
-          } catch (err) {
-            return { ...resume, details: null };
-          }
-        })
-      );
-
-      // Build CSV content
-      let csv = "Resume ID,Status,Final Score,Decision,Quality Score,Skill Match,Experience,Education,Semantic Match,Explanations\n";
-
-      detailedData.forEach((item) => {
-        const scores = item.details?.engine_scores || [];
-        const skillScore = scores.find(s => s.engine === "Skill Match")?.score || "";
-        const expScore = scores.find(s => s.engine === "Experience")?.score || "";
-        const eduScore = scores.find(s => s.engine === "Education")?.score || "";
-        const semScore = scores.find(s => s.engine === "Semantic Match")?.score || "";
-        const explanations = item.details?.explanations?.join("; ") || "";
+    for (let i = 0; i < loose.length; i += STREAM_MAX_IDS) {
+      const ids = loose.slice(i, i + STREAM_MAX_IDS);
+      openStatusStream(`ids=${encodeURIComponent(ids.join(","))}`);
+    }
+  };
 
-        csv += `${item.resume_id},${item.status},${item.final_score || ""},${item.decision || ""},${item.quality_score ? (item.quality_score * 100).toFixed(2) : ""},${skillScore},${expScore},${eduScore},${semScore},"${explanations}"\n`;
-      });
+  const openStatusStream = (query) => {
+    let errorCount = 0;
+    const source = new EventSource(`http://localhost:8000/api/resumes/events?${query}`);
+    const close = () => {
+      clearTimeout(lifetime);
+      source.close();
+    };
+    const lifetime = setTimeout(close, STREAM_MAX_LIFETIME_MS);
+
+    source.addEventListener("status", (event) => {
+      errorCount = 0;
+      const data = JSON.parse(event.data);
+      setResumes((prev) =>
+        prev.map((r) =>
+          r.resume_id === data.resume_id ? { ...r, ...data } : r
+        )
+      );
+    });
+
+    // "done": everything final; "expired": the server's lifetime cap
+    source.addEventListener("done", close);
+    source.addEventListener("expired", close);
+
+    source.onerror = (err) => {
+      // EventSource reconnects by itself; give up after repeated failures
+      console.error("Status stream error:", err);
+      errorCount++;
+      if (errorCount >= 3) {
+        close();
+      }
+    };
+  };
 
-      // Download CSV
-      const blob = new Blob([csv], { type: "text/csv" });
-      const url = window.URL.createObjectURL(blob);
-      const a = document.createElement("a");
-      a.href = url;
-      a.download = `resume_results_${new Date().toISOString().split('T')[0]}.csv`;
-      document.body.appendChild(a);
-      a.click();
-      document.body.removeChild(a);
-      window.URL.revokeObjectURL(url);
-    } catch (error) {
-      console.error("Export error:", error);
-      alert("Failed to export CSV");
+  const exportToCSV = () => {
+    if (processedResumes.length === 0) {
+      alert("No processed resumes to export");
+      return;
     }
+
+    // The server streams the file (scores and explanations joined there);
+    // the browser saves it as it arrives
+    const a = document.createElement("a");
+    a.href = "http://localhost:8000/api/resumes/export?format=csv&status=PROCESSED";
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
   };
 
   const deleteResume = async (resumeId) => {
@@ -1895,6 +1903,7 @@ export default function App() {
     try {
       await axios.delete("http://localhost:8000/api/resumes");
       setResumes([]);
+      setNextCursor(null);
       setSelected(null);
     } catch (error) {
       console.error("Clear all error:", error);
@@ -2595,6 +2604,25 @@ export default function App() {
               />
             );
           })}
+
+          {nextCursor && (
+            <button
+              onClick={() => loadResumes(nextCursor)}
+              style={{
+                width: "100%",
+                marginTop: 12,
+                padding: "8px 0",
+                fontSize: 12,
+                background: "transparent",
+                color: COLORS.muted,
+                border: `1px solid ${COLORS.border}`,
+                borderRadius: 6,
+                cursor: "pointer",
+              }}
+            >
+              Load older resumes
+            </button>
+          )}
         </div>
 
         {/* RIGHT PANEL */}
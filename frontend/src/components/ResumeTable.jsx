@@ -15,7 +15,7 @@ export default function ResumeTable({ resumes, onSelect }) {
           {resumes.map((r) => (
             <tr key={r.resume_id} onClick={() => onSelect(r.resume_id)}>
               <td>{r.candidate_name || "Unknown"}</td>
-              <td>{r.resume_id}</td>
+              <td>{r.display_id || r.resume_id}</td>
               <td>{r.status}</td>
               <td>{r.final_score ?? "-"}</td>
             </tr>